@@ -13,7 +13,7 @@ gzip: Standard gzip stream
 none/raw: No compression, returns input as is
 """
 
-import zlib, lzma, gzip
+import struct, zlib, lzma, gzip
 from typing import Optional
 
 
@@ -32,6 +32,10 @@ def u32_le(buf: bytes, off: int) -> int:
     )
 
 
+# u16 unk0, u16 file_type, u16 chunk_count, u16 unk1, u32 total_unc
+SPLIT_HEAD = struct.Struct("<4HI")
+
+
 def align_up(value: int, alignment: int) -> int:
     return (value + (alignment - 1)) & ~(alignment - 1)
 
@@ -252,11 +256,7 @@ def read_classic_split_zlib_layout(data: bytes):
     if len(data) < 0x0C:
         return None
 
-    unk0 = u16_le(data, 0x00)
-    file_type = u16_le(data, 0x02)
-    chunk_count = u16_le(data, 0x04)
-    unk1 = u16_le(data, 0x06)
-    total_unc = u32_le(data, 0x08)
+    unk0, file_type, chunk_count, unk1, total_unc = SPLIT_HEAD.unpack_from(data, 0)
 
     if chunk_count <= 0:
         return None
@@ -265,14 +265,9 @@ def read_classic_split_zlib_layout(data: bytes):
     if header_end > len(data):
         return None
 
-    sizes = []
-    off = 0x0C
-    for _ in range(chunk_count):
-        chunk_size = u32_le(data, off)
-        if chunk_size < 4:
-            return None
-        sizes.append(chunk_size)
-        off += 4
+    sizes = list(struct.unpack_from(f"<{chunk_count}I", data, 0x0C))
+    if min(sizes) < 4:
+        return None
 
     def try_fixed_omega_alignment():
         ptr = align_up(header_end, 0x80)
@@ -365,6 +360,11 @@ def read_classic_split_zlib_layout(data: bytes):
                 scan_limit = min(len(data) - (4 + inner_expected), cursor + 0x4000)
                 scan = max(cursor, 0)
                 while scan <= scan_limit:
+                    # Every zlib header starts with CMF 0x78, jump straight to the next one
+                    hit = data.find(b"\x78", scan + 4, scan_limit + 5)
+                    if hit < 0:
+                        break
+                    scan = hit - 4
                     if u32_le(data, scan) == inner_expected and looks_like_zlib_header(data, scan + 4):
                         found = {
                             "offset": scan,
@@ -397,7 +397,7 @@ def read_classic_split_zlib_layout(data: bytes):
     }
 
 
-def decompress_classic_split_zlib_streams(data: bytes) -> tuple[bytes, str]:
+def decompress_classic_split_zlib_streams(data: bytes, layout: dict | None = None) -> tuple[bytes, str]:
     """
     Omega-style split zlib stream format used for large G1M/G1T/etc assets
 
@@ -418,10 +418,13 @@ def decompress_classic_split_zlib_streams(data: bytes) -> tuple[bytes, str]:
         4 byte inner_size_i + inner_size_i bytes of zlib stream
         next chunk starts at align_up(end_i, 0x80)
 
+    layout: a read_classic_split_zlib_layout result for data when the caller already parsed it
+
     Returns:
       (merged_bytes, extension_str)
     """
-    layout = read_classic_split_zlib_layout(data)
+    if layout is None:
+        layout = read_classic_split_zlib_layout(data)
     if not layout:
         raise ValueError("split zlib stream: structure did not match")
 
@@ -463,12 +466,11 @@ def read_pairtable_split_zlib_wrapper(data: bytes, *, max_count: int = 4096):
     if table_end > len(data):
         return None
 
+    table = struct.unpack_from(f"<{count * 2}I", data, 4)
+
     entries = []
     previous_end = table_end
-    for index in range(count):
-        ent_off = 4 + index * 8
-        payload_off = u32_le(data, ent_off)
-        payload_size = u32_le(data, ent_off + 4)
+    for payload_off, payload_size in zip(table[0::2], table[1::2]):
         if payload_size <= 0:
             return None
         if payload_off < table_end or payload_off + payload_size > len(data):
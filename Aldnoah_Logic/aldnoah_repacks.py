@@ -1,6 +1,7 @@
 # Aldnoah_Logic/aldnoah_repacks.py
 
-import os, mmap, re
+import os, sys, mmap, struct
+from array import array
 
 from .aldnoah_unpack import (
     looks_like_classic_split_zlib,
@@ -16,24 +17,99 @@ from .aldnoah_unpack import (
     rebuild_subcontainer_from_folder,
     split_optional_taildata,
     read_universal_subcontainer_layout,
+    last_numeric_group,
+    zero_bytes,
+    KOVS_HEAD,
 )
 
 
+# KOVS size field on its own and the magic, for the metadata scan's resync path
+_U32 = struct.Struct("<I")
+
+# Output buffer and userland copy block size, large enough that runs of small chunks leave
+# as a few big writes rather than one syscall per default 8 KiB buffer fill
+_IO_BLOCK = 1024 * 1024
+
+# Bodies smaller than this go through the output buffer with their header and padding,
+# a sendfile would force a flush and a syscall for every small chunk
+_SENDFILE_MIN = 256 * 1024
+
 # Natural numeric sort for chunk filenames like 0.kvs/00000.kvs/entry_00000.kvs, etc
 # Ensures repack order matches the original sequential unpack order even when digit widths vary
-_NUM_RE = re.compile(r"(\d+)")
-
 def natural_kvs_sort_key(name: str):
     stem = os.path.splitext(name)[0]
-    nums = _NUM_RE.findall(stem)
-    if nums:
-        # Use the last numeric group in the stem (handles prefixes like entry_00012)
+    name_lower = name.lower()
+    # Fast path for the usual 00000.kvs style names written by the unpacker
+    if stem.isdecimal():
+        return (0, int(stem), stem, name_lower)
+    # ASCII lowering keeps the length, so the stem can be sliced out of name_lower
+    # instead of lowering it a second time
+    stem_lower = name_lower[:len(stem)] if name.isascii() else stem.lower()
+    # Use the last numeric group in the stem (handles prefixes like entry_00012)
+    num = last_numeric_group(stem)
+    if num is not None:
+        return (0, num, stem_lower, name_lower)
+    return (1, stem_lower, name_lower)
+
+def copy_file_bytes(fin, out_f, count: int, offset: int | None = None) -> int:
+    """
+    Copy up to count bytes from fin into out_f, starting at offset or at the current
+    position of fin when no offset is given, returns how many bytes were copied (short
+    only when fin ends first)
+
+    Prefers os.sendfile for large copies so the bytes move inside the kernel without
+    passing through Python, small copies, Windows, or filesystems that reject sendfile
+    between regular files use a buffered copy
+    """
+    remaining = count
+    copied = 0
+
+    sendfile = getattr(os, "sendfile", None)
+    if sendfile is not None and remaining >= _SENDFILE_MIN:
+        if offset is None:
+            offset = fin.tell()
+        # Anything still sitting in out_f's buffer has to land before the kernel writes
+        out_f.flush()
+        out_fd = out_f.fileno()
+        in_fd = fin.fileno()
         try:
-            num = int(nums[-1])
-        except ValueError:
-            num = None
-        return (0, num, stem.lower(), name.lower())
-    return (1, stem.lower(), name.lower())
+            while remaining > 0:
+                sent = sendfile(out_fd, in_fd, offset, remaining)
+                if sent <= 0:
+                    break
+                offset += sent
+                remaining -= sent
+                copied += sent
+        except OSError:
+            pass
+        if remaining <= 0:
+            return copied
+
+    # Finish whatever the kernel copy did not cover through userland, sendfile leaves the
+    # file position alone so only an explicit or advanced offset needs a seek
+    if offset is not None:
+        fin.seek(offset)
+    while remaining > 0:
+        block = fin.read(min(remaining, _IO_BLOCK))
+        if not block:
+            break
+        out_f.write(block)
+        remaining -= len(block)
+        copied += len(block)
+    return copied
+
+def advise_file(fd: int, advice_name: str) -> None:
+    """
+    Pass a posix_fadvise hint for the whole file, a no-op where the platform lacks it
+    """
+    fadvise = getattr(os, "posix_fadvise", None)
+    advice = getattr(os, advice_name, None)
+    if fadvise is None or advice is None:
+        return
+    try:
+        fadvise(fd, 0, 0, advice)
+    except OSError:
+        pass
 
 def repack_from_folder(
     folder_path: str,
@@ -70,44 +146,33 @@ def repack_from_folder(
     base_name = os.path.basename(folder_path)
     parent_dir = os.path.dirname(folder_path)
 
-    # Collect files in folder
-    all_files = [
-        f for f in os.listdir(folder_path)
-        if os.path.isfile(os.path.join(folder_path, f))
-    ]
+    # Collect files in folder, scandir entries carry the file type so this is one pass
+    # without a separate stat per name
+    with os.scandir(folder_path) as it:
+        all_files = [entry.name for entry in it if entry.is_file()]
 
     if not all_files:
         status(f"No files found in folder: {folder_path}", "red")
         return None
 
+    # Decide type:
+    # presence of .kvs files => KVS repack
+    # otherwise => universal non-KVS subcontainer rebuild
+    kvs_files = [f for f in all_files if f.lower().endswith(".kvs")]
+
     if base_file_path:
         base_file_path = os.path.abspath(base_file_path)
         try:
             with open(base_file_path, "rb") as handle:
-                base_blob = handle.read()
+                # KVS repacks only take the 6 byte taildata from the base file, only the
+                # universal rebuild needs the whole thing to detect its container type
+                base_blob = b"" if kvs_files else handle.read()
         except OSError as e:
             status(f"Could not read base file: {e}", "red")
             return None
     else:
         base_blob = b""
 
-    def looks_like_supported_raw(raw: bytes) -> bool:
-        return (
-            looks_like_mdlk_blob(raw)
-            or looks_like_kshl_blob(raw)
-            or looks_like_split_zlib_pairtable_wrapper(raw)
-            or looks_like_classic_split_zlib(raw)
-            or read_universal_subcontainer_layout(raw) is not None
-            or looks_like_embedded_mdlk_blob(raw)
-        )
-
-    base_raw_for_detect, _tail = split_optional_taildata(base_blob, looks_like_supported_raw)
-
-    # Decide type:
-    # presence of .kvs files => KVS repack
-    # otherwise => universal non-KVS subcontainer rebuild
-    kvs_files = [f for f in all_files if f.lower().endswith(".kvs")]
-
     if kvs_files:
         status(f"Detected KVS chunk folder: {base_name}", "blue")
         out_path = os.path.join(parent_dir, f"{base_name}.kvs")
@@ -123,6 +188,18 @@ def repack_from_folder(
         if not base_file_path:
             status("A base unpacked source file is required for universal subcontainer rebuilds.", "red")
             return None
+
+        def looks_like_supported_raw(raw: bytes) -> bool:
+            return (
+                looks_like_mdlk_blob(raw)
+                or looks_like_kshl_blob(raw)
+                or looks_like_split_zlib_pairtable_wrapper(raw)
+                or looks_like_classic_split_zlib(raw)
+                or read_universal_subcontainer_layout(raw) is not None
+                or looks_like_embedded_mdlk_blob(raw)
+            )
+
+        base_raw_for_detect, _tail = split_optional_taildata(base_blob, looks_like_supported_raw)
         if looks_like_mdlk_blob(base_raw_for_detect):
             status(f"Detected MDLK folder: {base_name}", "blue")
             try:
@@ -238,7 +315,12 @@ def repack_kvs_folder(
     """
 
     # Stable order, natural numeric sort (works for 0.kvs, 00000.kvs, entry_00000.kvs, etc)
-    kvs_files = sorted(kvs_files, key=natural_kvs_sort_key)
+    # Folders written by the unpacker are all 00000.kvs style names, those sort on the number
+    # alone (stem breaks ties like 01 vs 1) without building the general key per file
+    if all(name[:-4].isdecimal() for name in kvs_files):
+        kvs_files = sorted(kvs_files, key=lambda name: (int(name[:-4]), name[:-4]))
+    else:
+        kvs_files = sorted(kvs_files, key=natural_kvs_sort_key)
     total = len(kvs_files)
     if total == 0:
         status("No .kvs files inside folder to repack.", "red")
@@ -247,46 +329,66 @@ def repack_kvs_folder(
     status(f"Repacking {total} KOVS chunks into {os.path.basename(out_path)}", "blue")
 
     try:
-        with open(out_path, "wb") as out_f:
+        with open(out_path, "wb", buffering=_IO_BLOCK) as out_f:
+            # Track the output position locally instead of asking tell() after every chunk
+            cur_pos = 0
+            # Bound once, these are called for every chunk
+            join = os.path.join
+            write = out_f.write
+            unpack_head = KOVS_HEAD.unpack_from
             for idx, name in enumerate(kvs_files):
-                in_path = os.path.join(folder_path, name)
+                in_path = join(folder_path, name)
                 try:
-                    with open(in_path, "rb") as fin:
-                        blob = fin.read()
+                    # Unbuffered, only the 32 byte header is read in Python and the body is
+                    # handed to copy_file_bytes, so a read-ahead buffer would be wasted
+                    fin = open(in_path, "rb", buffering=0)
                 except OSError:
                     status(f"Could not read {name}, skipping.", "red")
                     continue
 
-                if len(blob) < 32 or not blob.startswith(b"KOVS"):
-                    status(f"{name} is not a valid KOVS file, skipping.", "red")
-                    continue
-
-                size = int.from_bytes(blob[4:8], "little", signed=False)
-                if size <= 0:
-                    status(f"{name} has non-positive data size, skipping.", "red")
-                    continue
-
-                data_start = 32
-                data_end = data_start + size
-                if data_end > len(blob):
-                    # Clamp to available data but warn
-                    status(
-                        f"{name}: header size exceeds file length, clamping.",
-                        "red",
-                    )
-                    data_end = len(blob)
-
-                # Write KOVS header/data, no trailing pad from source file
-                chunk = blob[:data_end]
-                out_f.write(chunk)
+                with fin:
+                    advise_file(fin.fileno(), "POSIX_FADV_SEQUENTIAL")
+                    try:
+                        header = fin.read(32)
+                    except OSError:
+                        status(f"Could not read {name}, skipping.", "red")
+                        continue
+
+                    if len(header) < 32:
+                        status(f"{name} is not a valid KOVS file, skipping.", "red")
+                        continue
+                    magic, size = unpack_head(header)
+                    if magic != b"KOVS":
+                        status(f"{name} is not a valid KOVS file, skipping.", "red")
+                        continue
+                    if size <= 0:
+                        status(f"{name} has non-positive data size, skipping.", "red")
+                        continue
+
+                    # Stream KOVS header/data, no trailing pad from source file, the copy
+                    # stops at end of file so the file length never needs a separate stat
+                    # fin already sits at the body after the header read, so no offset/seek
+                    data_start = 32
+                    write(header)
+                    copied = copy_file_bytes(fin, out_f, size)
+                    data_end = data_start + copied
+                    if copied < size:
+                        # Clamped to available data but warn
+                        status(
+                            f"{name}: header size exceeds file length, clamping.",
+                            "red",
+                        )
+                    # Each chunk is read exactly once, let the kernel drop it from the page cache
+                    advise_file(fin.fileno(), "POSIX_FADV_DONTNEED")
 
                 # Pad up to 16 byte boundary
-                cur_pos = out_f.tell()
-                pad_len = (-cur_pos) % 16
+                pad_len = (-(cur_pos + data_end)) % 16
                 if pad_len:
-                    out_f.write(b"\x00" * pad_len)
+                    write(zero_bytes(pad_len))
+                cur_pos += data_end + pad_len
 
-                if progress is not None:
+                # Report in batches like the unpackers, every callback crosses into the GUI thread
+                if progress is not None and ((idx & 31) == 0 or idx + 1 == total):
                     progress(
                         idx + 1,
                         total,
@@ -376,18 +478,37 @@ def update_kvs_metadata(
     with open(kvs_subcontainer_path, "rb") as kf:
         mm = mmap.mmap(kf.fileno(), 0, access=mmap.ACCESS_READ)
         try:
+            # The scan only moves forward through the mapping
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
             n = len(mm)
             pos = 0
             idx = 0
-
-            while idx < expected:
-                found = mm.find(b"KOVS", pos)
-                if found < 0:
-                    break
-                if found + 8 > n:
-                    break
-
-                data_size = int.from_bytes(mm[found + 4:found + 8], "little", signed=False)
+            find = mm.find
+            unpack_head = KOVS_HEAD.unpack_from
+
+            while idx < expected and pos + 8 <= n:
+                # Regularly packed files put the next header on the following 16 byte boundary
+                # after zero padding, read magic + size there in one unpack and only search
+                # when that guess misses
+                found = (pos + 15) & ~15
+                if found + 8 <= n and (found == pos or not mm[pos:found].strip(b"\x00")):
+                    magic, data_size = unpack_head(mm, found)
+                else:
+                    magic = b""
+                if magic != b"KOVS":
+                    # Chunks sit back to back with at most 15 bytes of alignment padding, probe
+                    # that window first and only fall back to scanning the rest of the file to resync
+                    found = find(b"KOVS", pos, pos + 19)
+                    if found < 0:
+                        # A plain find pins no buffer export on the map, so the close below cannot fail
+                        found = find(b"KOVS", pos)
+                    if found < 0:
+                        break
+                    if found + 8 > n:
+                        break
+
+                    (data_size,) = _U32.unpack_from(mm, found + 4)
                 chunk_size = 32 + data_size
 
                 # resync if implausible
@@ -405,10 +526,7 @@ def update_kvs_metadata(
                     progress(idx, expected, f"Scanning KVS {idx}/{expected}")
 
         finally:
-            try:
-                mm.close()
-            except Exception:
-                pass
+            mm.close()
 
     found_n = len(offsets)
     if found_n == 0:
@@ -417,15 +535,17 @@ def update_kvs_metadata(
     status(f"Found {found_n}/{expected} KOVS entries. Writing metadata TOC", "blue")
     progress(0, max(1, expected), "Updating metadata")
 
+    # The TOC is one contiguous run of offset/size pairs, interleave them with two strided
+    # array assignments (no per-value Python work) and write the whole run once
+    toc = array("I", bytes(8 * found_n))
+    toc[0::2] = array("I", offsets)
+    toc[1::2] = array("I", sizes)
+    if sys.byteorder != "little":
+        toc.byteswap()
     with open(metadata_bin_path, "r+b") as mf:
-        for i, (off, sz) in enumerate(zip(offsets, sizes)):
-            ent_pos = 8 + i * 8
-            mf.seek(ent_pos)
-            mf.write(off.to_bytes(4, "little", signed=False))
-            mf.write(sz.to_bytes(4, "little", signed=False))
-
-            if (i + 1) % 512 == 0 or (i + 1) == found_n:
-                progress(i + 1, expected, f"Updating metadata {i + 1}/{expected}")
+        mf.seek(toc_start)
+        mf.write(toc)
+    progress(found_n, expected, f"Updating metadata {found_n}/{expected}")
 
     if found_n != expected:
         status(
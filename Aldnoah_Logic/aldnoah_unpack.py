@@ -1,6 +1,12 @@
 # Aldnoah_Logic/aldnoah_unpack.py
 
-import mmap, os, re, struct, zlib
+import mmap, os, struct, sys, time, zlib
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import compress
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
 
 from .aldnoah_codecs import (
     decompress as codec_decompress,
@@ -71,7 +77,42 @@ def looks_like_classic_split_zlib(raw: bytes) -> bool:
     return codec_read_classic_split_zlib_layout(raw) is not None
 
 
+def may_be_split_zlib(raw: bytes) -> bool:
+    """
+    Constant time header prefilter for looks_like_split_zlib
+
+    Only rejects blobs neither split-zlib layout could accept, so most PNG/OGG/etc entries never reach the full probes
+    """
+    n = len(raw)
+    if n < 0x0C:
+        return False
+
+    # Classic: chunk_count at 0x04 and the first chunk must fit after the size table
+    chunk_count = u16_le(raw, 0x04)
+    if chunk_count:
+        header_end = 0x0C + 4 * chunk_count
+        if header_end <= n:
+            first_size = u32_le(raw, 0x0C)
+            if first_size >= 4 and header_end + first_size <= n:
+                return True
+
+    # Pairtable wrapper: count at 0x00 and the first member must sit inside the blob after the table
+    if n < 20:
+        return False
+    count = u32_le(raw, 0x00)
+    if count < 1 or count > 4096:
+        return False
+    table_end = 4 + count * 8
+    if table_end > n:
+        return False
+    payload_off = u32_le(raw, 0x04)
+    payload_size = u32_le(raw, 0x08)
+    return payload_size > 0 and payload_off >= table_end and payload_off + payload_size <= n
+
+
 def looks_like_split_zlib(raw: bytes) -> bool:
+    if not may_be_split_zlib(raw):
+        return False
     return looks_like_classic_split_zlib(raw) or looks_like_split_zlib_pairtable_wrapper(raw)
 
 
@@ -85,6 +126,10 @@ def looks_like_split_zlib_pairtable_wrapper(raw: bytes, *, max_count: int = 4096
     return True
 
 
+# (offset, size) row of a pairtable TOC
+PAIR_ENTRY = struct.Struct("<II")
+
+
 def looks_like_nested_subcontainer_structure(raw: bytes, *, max_count: int = 100_000) -> bool:
     """
     Shallow structural probe for nested subcontainers, this intentionally avoids
@@ -106,10 +151,7 @@ def looks_like_nested_subcontainer_structure(raw: bytes, *, max_count: int = 100
             positive = 0
             last_off = -1
             valid = True
-            for idx in range(count):
-                ent_off = 4 + idx * 8
-                off = int.from_bytes(raw[ent_off:ent_off + 4], "little", signed=False)
-                sz = int.from_bytes(raw[ent_off + 4:ent_off + 8], "little", signed=False)
+            for off, sz in PAIR_ENTRY.iter_unpack(raw[4:pair_table_end]):
                 if sz <= 0:
                     continue
                 if off < pair_table_end or off + sz > n or off < last_off:
@@ -123,7 +165,7 @@ def looks_like_nested_subcontainer_structure(raw: bytes, *, max_count: int = 100
     if count >= 2:
         toc_table_end = 4 + count * 4
         if toc_table_end <= n:
-            offsets = [int.from_bytes(raw[4 + idx * 4:8 + idx * 4], "little", signed=False) for idx in range(count)]
+            offsets = struct.unpack_from(f"<{count}I", raw, 4)
             valid_offsets = [off for off in offsets if toc_table_end <= off < n]
             if len(valid_offsets) >= 2:
                 return True
@@ -154,28 +196,28 @@ def payload_looks_meaningful(raw: bytes, *, allow_split_wrapper: bool = False) -
 
 
 def build_contiguous_pairtable_blob(chunks: list[bytes]) -> bytes:
-    rebuilt = bytearray()
-    rebuilt.extend(int(len(chunks)).to_bytes(4, "little", signed=False))
-
     header_end = 4 + (len(chunks) * 8)
     cursor = align_up(header_end, 16)
+    sizes = [len(chunk) for chunk in chunks]
     payload_offsets: list[int] = []
-    for chunk in chunks:
+    for size in sizes:
         payload_offsets.append(cursor)
-        rebuilt.extend(int(cursor).to_bytes(4, "little", signed=False))
-        rebuilt.extend(int(len(chunk)).to_bytes(4, "little", signed=False))
-        cursor = align_up(cursor + len(chunk), 16)
-
-    if payload_offsets and len(rebuilt) < payload_offsets[0]:
-        rebuilt.extend(b"\x00" * (payload_offsets[0] - len(rebuilt)))
-
+        cursor = align_up(cursor + size, 16)
+
+    # count, then offset/size pairs interleaved by strided array assignment
+    toc = array("I", bytes(header_end))
+    toc[0] = len(chunks)
+    toc[1::2] = array("I", payload_offsets)
+    toc[2::2] = array("I", sizes)
+    if sys.byteorder != "little":
+        toc.byteswap()
+
+    # Every offset is known up front, so allocate the final zero filled size once and
+    # drop the chunks in place instead of extending with explicit gap/pad zeros
+    rebuilt = bytearray(cursor if chunks else header_end)
+    rebuilt[0:header_end] = toc
     for chunk, payload_off in zip(chunks, payload_offsets):
-        if len(rebuilt) < payload_off:
-            rebuilt.extend(b"\x00" * (payload_off - len(rebuilt)))
-        rebuilt.extend(chunk)
-        pad_len = align_up(len(rebuilt), 16) - len(rebuilt)
-        if pad_len:
-            rebuilt.extend(b"\x00" * pad_len)
+        rebuilt[payload_off:payload_off + len(chunk)] = chunk
 
     return bytes(rebuilt)
 
@@ -211,6 +253,27 @@ def prepare_split_zlib_entry_for_unpack(raw: bytes) -> tuple[bytes, str | None,
     return data, ext_hint, True
 
 
+def try_prepare_split_zlib_entry(raw: bytes) -> tuple[bytes, str | None, bool] | None:
+    """
+    looks_like_split_zlib followed by prepare_split_zlib_entry_for_unpack, parsing the layout once
+
+    Returns None when raw is not split zlib, otherwise what prepare_split_zlib_entry_for_unpack returns
+    """
+    if not may_be_split_zlib(raw):
+        return None
+    if looks_like_split_zlib_pairtable_wrapper(raw):
+        return raw, None, False
+    layout = codec_read_classic_split_zlib_layout(raw)
+    if layout is None:
+        return None
+    try:
+        data, ext_hint = decompress_classic_split_zlib_streams(raw, layout)
+    except Exception:
+        # Rerun the full path so failures report exactly what they always did
+        data, ext_hint = decompress_split_zlib_streams(raw)
+    return data, ext_hint, True
+
+
 def read_classic_split_zlib_layout(blob: bytes):
     layout = codec_read_classic_split_zlib_layout(blob)
     if not layout:
@@ -263,7 +326,7 @@ def read_classic_split_zlib_layout(blob: bytes):
 
 def resolve_unpacked_extension(data: bytes, ext_hint: str | None = None) -> str:
     ext = detect_ext(data)
-    if ext in (".ini", ".txt") and b"\x00" in data[:64]:
+    if ext in (".ini", ".txt") and data.find(b"\x00", 0, 64) >= 0:
         return ".bin"
     if ext != ".bin":
         return ext
@@ -290,8 +353,7 @@ def unpack_classic_split_zlib_resource(path: str, blob: bytes) -> bool:
 
     ext = resolve_unpacked_extension(merged, ext_hint)
     out_path = os.path.join(out_dir, f"000{ext}")
-    with open(out_path, "wb") as handle:
-        handle.write(merged)
+    write_unpacked_entry(out_path, merged, b"")
 
     if ext in (".bin", ".kvs"):
         unpack_nested_resource(out_path, blob=merged)
@@ -315,16 +377,12 @@ def unpack_split_zlib_wrapper_blob(path: str, blob: bytes) -> bool:
     for index, (payload_off, payload_size) in enumerate(entries):
         payload = blob[payload_off:payload_off + payload_size]
         child_path = os.path.join(out_dir, f"{index:03d}.bin")
-        with open(child_path, "wb") as handle:
-            handle.write(payload)
+        write_unpacked_entry(child_path, payload, b"")
         unpack_nested_resource(child_path, blob=payload)
 
     return True
 
 
-NUM_RE = re.compile(r"(\d+)")
-
-
 def match_known_signature(data: bytes, off: int):
     if off < 0 or off + 4 > len(data):
         return None
@@ -490,15 +548,33 @@ def decompress_zl_bytes(buf: bytes) -> bytes:
     return bytes(out[:total_out])
 
 
+def last_numeric_group(stem: str) -> int | None:
+    """
+    Value of the last run of decimal digits in stem, or None if it has none
+
+    Walks in from the right instead of running a regex findall, sort keys call this
+    once per file and KVS folders can hold tens of thousands of chunks
+    """
+    end = len(stem)
+    while end > 0 and not stem[end - 1].isdecimal():
+        end -= 1
+    if end == 0:
+        return None
+    start = end - 1
+    while start > 0 and stem[start - 1].isdecimal():
+        start -= 1
+    return int(stem[start:end])
+
+
 def subcontainer_file_sort_key(path: str):
     stem = os.path.splitext(os.path.basename(path))[0]
-    nums = NUM_RE.findall(stem)
-    if nums:
-        try:
-            return (0, int(nums[-1]), stem.lower())
-        except ValueError:
-            pass
-    return (1, stem.lower())
+    stem_lower = stem.lower()
+    if stem.isdecimal():
+        return (0, int(stem), stem_lower)
+    num = last_numeric_group(stem)
+    if num is not None:
+        return (0, num, stem_lower)
+    return (1, stem_lower)
 
 
 def next_available_output_path(path: str) -> str:
@@ -514,6 +590,22 @@ def next_available_output_path(path: str) -> str:
         counter += 1
 
 
+# Shared run of zeros for alignment and gap padding, callers take views of it instead of
+# allocating a fresh b"\x00" * n at every pad site
+ZERO_PAD = memoryview(bytes(4096))
+
+
+def zero_bytes(count: int):
+    """
+    count zero bytes as a view of ZERO_PAD when it fits, a fresh bytes object otherwise
+    """
+    if count <= 0:
+        return ZERO_PAD[:0]
+    if count <= len(ZERO_PAD):
+        return ZERO_PAD[:count]
+    return bytes(count)
+
+
 def align_up(value: int, alignment: int = 16) -> int:
     return (value + (alignment - 1)) & ~(alignment - 1)
 
@@ -524,32 +616,38 @@ def choose_sequential_data_start(blob: bytes, table_end: int, sizes: list[int])
     if table_end + need > n:
         return table_end
 
-    candidates = [table_end]
-    scan_limit = min(n, table_end + 0x4000)
-    for off in range(table_end, scan_limit, 4):
-        if off + 4 > n:
-            break
-        if blob[off:off + 4] != b"\x00\x00\x00\x00":
-            candidates.append(off)
-            break
+    probe_sizes = sizes[:6]
 
-    best = table_end
-    best_score = -1
-    for cand in candidates:
-        if cand < table_end or cand + need > n:
-            continue
+    def score_start(cand: int) -> int:
         score = 0
         cur = cand
-        for sz in sizes[:min(6, len(sizes))]:
+        for sz in probe_sizes:
             if sz <= 0 or cur + sz > n:
                 break
             if payload_looks_meaningful(blob[cur:cur + sz]):
                 score += 1
             cur += sz
-        if score > best_score:
-            best_score = score
-            best = cand
-    return best
+        return score
+
+    # Every probed payload already looks right at table_end, no other start can score higher
+    best_score = score_start(table_end)
+    if best_score == len(probe_sizes):
+        return table_end
+
+    # The other candidate is the first non zero dword after the table, found by one C level lstrip
+    scan_limit = min(n, table_end + 0x4000)
+    dwords = min(-(-(scan_limit - table_end) // 4), (n - table_end) // 4)
+    window = blob[table_end:table_end + dwords * 4]
+    padding = len(window) - len(window.lstrip(b"\x00"))
+    if padding == len(window):
+        return table_end
+
+    cand = table_end + (padding & ~3)
+    if cand + need > n:
+        return table_end
+    if score_start(cand) > best_score:
+        return cand
+    return table_end
 
 
 def read_sequential_subcontainer_layout(blob: bytes, *, max_count: int = 100_000):
@@ -568,16 +666,15 @@ def read_sequential_subcontainer_layout(blob: bytes, *, max_count: int = 100_000
     if table_end > n:
         return None
 
-    sizes = []
-    for idx in range(count):
-        off = 4 + idx * 4
-        sizes.append(int.from_bytes(blob[off:off + 4], "little", signed=False))
+    # The whole size table in one unpack instead of a slice + int.from_bytes per entry
+    sizes = list(struct.unpack_from(f"<{count}I", blob, 4))
+    total_size = sum(sizes)
 
-    if sum(sizes) <= 0:
+    if total_size <= 0:
         return None
 
     data_start = choose_sequential_data_start(blob, table_end, sizes)
-    if data_start + sum(sizes) > n:
+    if data_start + total_size > n:
         return None
 
     hits = 0
@@ -631,10 +728,8 @@ def read_pairtable_subcontainer_layout(blob: bytes, *, max_count: int = 100_000)
     last_off = -1
     meaningful_indices = set()
 
-    for idx in range(count):
-        ent_off = 4 + idx * 8
-        off = int.from_bytes(blob[ent_off:ent_off + 4], "little", signed=False)
-        sz = int.from_bytes(blob[ent_off + 4:ent_off + 8], "little", signed=False)
+    # Rows come out of one C-level iterator instead of two slices + int.from_bytes each
+    for idx, (off, sz) in enumerate(PAIR_ENTRY.iter_unpack(blob[4:table_end])):
         entries.append((off, sz))
 
         if sz <= 0:
@@ -1271,20 +1366,20 @@ def build_relative_pair_block(layout: dict, chunks: list[bytes]) -> bytes:
     rebuilt = bytearray(layout.get("raw_bytes", b""))
     minimum_header = payload_base_rel
     if len(rebuilt) < minimum_header:
-        rebuilt.extend(b"\x00" * (minimum_header - len(rebuilt)))
+        rebuilt.extend(zero_bytes(minimum_header - len(rebuilt)))
 
-    struct.pack_into("<I", rebuilt, 0, int(layout["declared_count"]))
-    struct.pack_into("<I", rebuilt, 4, payload_base_rel)
-    for idx, (rel_off, sz) in enumerate(new_entries):
-        struct.pack_into("<I", rebuilt, 8 + idx * 8, int(rel_off))
-        struct.pack_into("<I", rebuilt, 8 + idx * 8 + 4, int(sz))
+    header_values = [int(layout["declared_count"]), payload_base_rel]
+    for rel_off, sz in new_entries:
+        header_values.append(int(rel_off))
+        header_values.append(int(sz))
+    struct.pack_into(f"<{len(header_values)}I", rebuilt, 0, *header_values)
 
     reserved_start = 8 + len(new_entries) * 8
     if reserved_start + len(reserved) > len(rebuilt):
-        rebuilt.extend(b"\x00" * (reserved_start + len(reserved) - len(rebuilt)))
+        rebuilt.extend(zero_bytes(reserved_start + len(reserved) - len(rebuilt)))
     rebuilt[reserved_start:reserved_start + len(reserved)] = reserved
     if len(rebuilt) < payload_base_rel:
-        rebuilt.extend(b"\x00" * (payload_base_rel - len(rebuilt)))
+        rebuilt.extend(zero_bytes(payload_base_rel - len(rebuilt)))
     elif len(rebuilt) > payload_base_rel:
         pass
 
@@ -1294,16 +1389,19 @@ def build_relative_pair_block(layout: dict, chunks: list[bytes]) -> bytes:
             abs_off = payload_base_rel + rel_off
             zero_start = abs_off + len(chunk)
             zero_end = abs_off + old_sz
+            # Only the stale bytes already in the buffer need clearing, growing it zero fills the rest
+            clear_end = min(zero_end, len(rebuilt))
+            if zero_start < clear_end:
+                rebuilt[zero_start:clear_end] = zero_bytes(clear_end - zero_start)
             if len(rebuilt) < zero_end:
-                rebuilt.extend(b"\x00" * (zero_end - len(rebuilt)))
-            rebuilt[zero_start:zero_end] = b"\x00" * max(0, zero_end - zero_start)
+                rebuilt.extend(zero_bytes(zero_end - len(rebuilt)))
 
     for (rel_off, _sz), chunk in zip(new_entries, chunks):
         if not chunk:
             continue
         abs_off = payload_base_rel + rel_off
         if len(rebuilt) < abs_off + len(chunk):
-            rebuilt.extend(b"\x00" * (abs_off + len(chunk) - len(rebuilt)))
+            rebuilt.extend(zero_bytes(abs_off + len(chunk) - len(rebuilt)))
         for prev_start, prev_end in written_ranges:
             overlap_start = max(abs_off, prev_start)
             overlap_end = min(abs_off + len(chunk), prev_end)
@@ -1339,27 +1437,30 @@ def build_relative_pairtable_block(layout: dict, chunks: list[bytes]) -> bytes:
     rebuilt = bytearray(layout.get("raw_bytes", b""))
     minimum_header = 4 + count * 8
     if len(rebuilt) < minimum_header:
-        rebuilt.extend(b"\x00" * (minimum_header - len(rebuilt)))
+        rebuilt.extend(zero_bytes(minimum_header - len(rebuilt)))
 
-    struct.pack_into("<I", rebuilt, 0, int(count))
-    for idx, (rel_off, sz) in enumerate(new_entries):
-        struct.pack_into("<I", rebuilt, 4 + idx * 8, int(rel_off))
-        struct.pack_into("<I", rebuilt, 4 + idx * 8 + 4, int(sz))
+    header_values = [int(count)]
+    for rel_off, sz in new_entries:
+        header_values.append(int(rel_off))
+        header_values.append(int(sz))
+    struct.pack_into(f"<{len(header_values)}I", rebuilt, 0, *header_values)
 
     written_ranges: list[tuple[int, int]] = []
     for (rel_off, old_sz, _old_abs_off), chunk in zip(layout["entries"], chunks):
         if old_sz > len(chunk):
             zero_start = rel_off + len(chunk)
             zero_end = rel_off + old_sz
+            clear_end = min(zero_end, len(rebuilt))
+            if zero_start < clear_end:
+                rebuilt[zero_start:clear_end] = zero_bytes(clear_end - zero_start)
             if len(rebuilt) < zero_end:
-                rebuilt.extend(b"\x00" * (zero_end - len(rebuilt)))
-            rebuilt[zero_start:zero_end] = b"\x00" * max(0, zero_end - zero_start)
+                rebuilt.extend(zero_bytes(zero_end - len(rebuilt)))
 
     for (rel_off, _sz), chunk in zip(new_entries, chunks):
         if not chunk:
             continue
         if len(rebuilt) < rel_off + len(chunk):
-            rebuilt.extend(b"\x00" * (rel_off + len(chunk) - len(rebuilt)))
+            rebuilt.extend(zero_bytes(rel_off + len(chunk) - len(rebuilt)))
         for prev_start, prev_end in written_ranges:
             overlap_start = max(rel_off, prev_start)
             overlap_end = min(rel_off + len(chunk), prev_end)
@@ -1547,7 +1648,7 @@ def rebuild_subcontainer_raw_from_chunks(original_raw: bytes, layout: dict, chun
             if original_start >= block_start:
                 block_start = original_start
             if len(rebuilt) < block_start:
-                rebuilt.extend(b"\x00" * (block_start - len(rebuilt)))
+                rebuilt.extend(zero_bytes(block_start - len(rebuilt)))
             later_offsets.append(block_start)
             if block["kind"] == "rawblock":
                 rebuilt.extend(block.get("raw_bytes", b""))
@@ -1617,12 +1718,14 @@ def rebuild_subcontainer_raw_from_chunks(original_raw: bytes, layout: dict, chun
 
         data_start = int(layout["data_start"])
         pad_len = max(0, data_start - layout["table_end"])
-        rebuilt = bytearray()
-        rebuilt.extend(int(layout["count"]).to_bytes(4, "little", signed=False))
-        for chunk in chunks:
-            rebuilt.extend(int(len(chunk)).to_bytes(4, "little", signed=False))
+        # Count plus every size in one pack instead of one 4 byte extend per entry
+        rebuilt = bytearray(struct.pack(
+            f"<I{len(chunks)}I",
+            int(layout["count"]),
+            *(len(chunk) for chunk in chunks),
+        ))
         if pad_len:
-            rebuilt.extend(b"\x00" * pad_len)
+            rebuilt.extend(zero_bytes(pad_len))
         for chunk in chunks:
             rebuilt.extend(chunk)
         return bytes(rebuilt)
@@ -1660,30 +1763,77 @@ def rebuild_subcontainer_raw_from_chunks(original_raw: bytes, layout: dict, chun
         else:
             offsets.append(0)
 
-    rebuilt = bytearray()
-    rebuilt.extend(int(layout["count"]).to_bytes(4, "little", signed=False))
-    for off, sz in zip(offsets, sizes):
-        rebuilt.extend(int(off).to_bytes(4, "little", signed=False))
-        rebuilt.extend(int(sz).to_bytes(4, "little", signed=False))
-
+    # Every payload position is known before any bytes are copied, so size the output
+    # once and drop each chunk in place, the gaps are already zero in the fresh buffer
+    header_len = 4 + 8 * len(offsets)
+    cur = header_len
     if offsets:
         first_positive = next((off for off, sz in zip(offsets, sizes) if sz > 0), 0)
-        cur = len(rebuilt)
-        if first_positive > cur:
-            rebuilt.extend(b"\x00" * (first_positive - cur))
+        cur = max(cur, first_positive)
 
+    placements: list[tuple[int, bytes]] = []
     for idx, chunk in sorted(payload_by_slot.items()):
         if not chunk:
             continue
-        target_off = offsets[idx]
-        cur = len(rebuilt)
-        if cur < target_off:
-            rebuilt.extend(b"\x00" * (target_off - cur))
-        rebuilt.extend(chunk)
+        place = max(cur, offsets[idx])
+        placements.append((place, chunk))
+        cur = place + len(chunk)
+
+    rebuilt = bytearray(cur)
+    # Count plus the interleaved offset/size pairs in one pack
+    struct.pack_into(
+        f"<I{2 * len(offsets)}I",
+        rebuilt,
+        0,
+        int(layout["count"]),
+        *(value for pair in zip(offsets, sizes) for value in pair),
+    )
+    for place, chunk in placements:
+        rebuilt[place:place + len(chunk)] = chunk
 
     return bytes(rebuilt)
 
 
+def iter_subcontainer_members(blob: bytes, layout: dict):
+    """
+    Yield (name_stem, start, end) for every member file of a universal subcontainer layout, in output order
+    start == end marks an empty member, which is still written out as an empty .bin
+    """
+    kind = layout["kind"]
+    if kind == "multiblock":
+        out_index = 0
+        for block in [layout["primary_block"], *layout["later_blocks"]]:
+            for start, sz in block_entry_offsets(block):
+                yield f"{out_index:03d}", start, start + max(sz, 0)
+                out_index += 1
+    elif kind == "wrapper_pairs":
+        for idx, (start, sz) in enumerate(iter_layout_payload_ranges(blob, layout)):
+            yield f"entry_{idx:03d}", start, start + sz
+    elif kind == "offsets":
+        unique_offsets = layout["unique_offsets"]
+        for idx, start in enumerate(unique_offsets):
+            end = unique_offsets[idx + 1] if idx + 1 < len(unique_offsets) else len(blob)
+            if end > start:
+                yield f"entry_{idx:03d}", start, end
+    elif kind == "sequential":
+        cur = layout["data_start"]
+        for idx, sz in enumerate(layout["sizes"]):
+            if sz <= 0:
+                yield f"{idx:03d}", cur, cur
+                continue
+            if cur + sz > len(blob):
+                return
+            yield f"{idx:03d}", cur, cur + sz
+            cur += sz
+    else:
+        for idx, (off, sz) in enumerate(layout["entries"]):
+            if sz <= 0:
+                continue
+            if off + sz > len(blob):
+                return
+            yield f"{idx:03d}", off, off + sz
+
+
 def try_unpack_subcontainer_blob(blob: bytes, out_dir: str) -> bool:
     if looks_like_split_zlib_pairtable_wrapper(blob):
         return False
@@ -1700,108 +1850,41 @@ def try_unpack_subcontainer_blob(blob: bytes, out_dir: str) -> bool:
         return try_unpack_subcontainer_blob(inner_blob, out_dir)
 
     def write_payload_file(out_path: str, chunk: bytes, *, allow_nested: bool = True):
-        with open(out_path, "wb") as fout:
-            fout.write(chunk)
         if allow_nested:
+            # Recursion reads the member back by path, so it has to land first
+            write_unpacked_entry(out_path, chunk, b"")
             unpack_nested_resource(out_path, blob=chunk)
+            return
+        # Leaf members write on the pool while the next member's extension is resolved here
+        pending.append(MEMBER_WRITE_POOL.submit(write_unpacked_entry, out_path, chunk, b""))
+        if len(pending) >= UNPACK_QUEUE_LIMIT:
+            pending.popleft().result()
 
     os.makedirs(out_dir, exist_ok=True)
-    if layout["kind"] == "multiblock":
-        out_index = 0
-        for abs_off, sz in block_entry_offsets(layout["primary_block"]):
-            if sz <= 0:
-                out_path = os.path.join(out_dir, f"{out_index:03d}.bin")
-                with open(out_path, "wb") as fout:
-                    fout.write(b"")
-                out_index += 1
-                continue
-            chunk = blob[abs_off:abs_off + sz]
-            inner_ext = resolve_nested_payload_extension(chunk)
-            out_path = os.path.join(out_dir, f"{out_index:03d}{inner_ext}")
-            write_payload_file(
-                out_path,
-                chunk,
-                allow_nested=should_recurse_nested_payload(inner_ext, chunk),
-            )
-            out_index += 1
-
-        for block in layout["later_blocks"]:
-            for start, sz in block_entry_offsets(block):
-                if sz <= 0:
-                    out_path = os.path.join(out_dir, f"{out_index:03d}.bin")
-                    with open(out_path, "wb") as fout:
-                        fout.write(b"")
-                    out_index += 1
-                    continue
-                chunk = blob[start:start + sz]
-                inner_ext = resolve_nested_payload_extension(chunk)
-                out_path = os.path.join(out_dir, f"{out_index:03d}{inner_ext}")
-                write_payload_file(
-                    out_path,
-                    chunk,
-                    allow_nested=should_recurse_nested_payload(inner_ext, chunk),
-                )
-                out_index += 1
-    elif layout["kind"] == "wrapper_pairs":
-        for idx, (start, sz) in enumerate(iter_layout_payload_ranges(blob, layout)):
-            chunk = blob[start:start + sz]
-            inner_ext = resolve_nested_payload_extension(chunk)
-            out_path = os.path.join(out_dir, f"entry_{idx:03d}{inner_ext}")
-            write_payload_file(
-                out_path,
-                chunk,
-                allow_nested=should_recurse_nested_payload(inner_ext, chunk),
-            )
-    elif layout["kind"] == "offsets":
-        unique_offsets = layout["unique_offsets"]
-        for idx, start in enumerate(unique_offsets):
-            end = unique_offsets[idx + 1] if idx + 1 < len(unique_offsets) else len(blob)
+    pending = deque()
+    try:
+        for stem, start, end in iter_subcontainer_members(blob, layout):
             if end <= start:
+                write_unpacked_entry(os.path.join(out_dir, f"{stem}.bin"), b"", b"")
                 continue
             chunk = blob[start:end]
             inner_ext = resolve_nested_payload_extension(chunk)
-            out_path = os.path.join(out_dir, f"entry_{idx:03d}{inner_ext}")
             write_payload_file(
-                out_path,
-                chunk,
-                allow_nested=should_recurse_nested_payload(inner_ext, chunk),
-            )
-    elif layout["kind"] == "sequential":
-        cur = layout["data_start"]
-        for idx, sz in enumerate(layout["sizes"]):
-            if sz <= 0:
-                out_path = os.path.join(out_dir, f"{idx:03d}.bin")
-                with open(out_path, "wb") as fout:
-                    fout.write(b"")
-                continue
-            if cur + sz > len(blob):
-                break
-            chunk = blob[cur:cur + sz]
-            cur += sz
-            inner_ext = resolve_nested_payload_extension(chunk)
-            out_path = os.path.join(out_dir, f"{idx:03d}{inner_ext}")
-            write_payload_file(
-                out_path,
-                chunk,
-                allow_nested=should_recurse_nested_payload(inner_ext, chunk),
-            )
-    else:
-        for idx, (off, sz) in enumerate(layout["entries"]):
-            if sz <= 0:
-                continue
-            if off + sz > len(blob):
-                break
-            chunk = blob[off:off + sz]
-            inner_ext = resolve_nested_payload_extension(chunk)
-            out_path = os.path.join(out_dir, f"{idx:03d}{inner_ext}")
-            write_payload_file(
-                out_path,
+                os.path.join(out_dir, f"{stem}{inner_ext}"),
                 chunk,
                 allow_nested=should_recurse_nested_payload(inner_ext, chunk),
             )
+        while pending:
+            pending.popleft().result()
+    finally:
+        settle_member_writes(pending)
     return True
 
 
+# KOVS chunk header prefix: magic + little endian data size
+KOVS_HEAD = struct.Struct("<4sI")
+
+
 def unpack_kvs_blob(blob: bytes, out_dir: str) -> bool:
     n = len(blob)
     if n < 32 or blob[:4] != b"KOVS":
@@ -1810,45 +1893,80 @@ def unpack_kvs_blob(blob: bytes, out_dir: str) -> bool:
     os.makedirs(out_dir, exist_ok=True)
     pos = 0
     index = 0
-    while True:
-        if pos + 32 > n:
-            break
+    # Member writes are pure syscalls, so the write pool overlaps them while this thread keeps scanning
+    view = memoryview(blob)
+    pending = deque()
+    # The member views handed to the pool, released once their writes are settled so a mapped blob can close
+    chunks = deque()
+    try:
+        while True:
+            if pos + 32 > n:
+                break
+
+            magic, size = KOVS_HEAD.unpack_from(blob, pos)
+            if magic != b"KOVS":
+                # Resync on the next KOVS on the 4 byte grid from pos, off-grid hits are skipped
+                scan = blob.find(b"KOVS", pos)
+                while scan >= 0 and (scan - pos) & 3:
+                    scan = blob.find(b"KOVS", scan + 1)
+                if scan < 0:
+                    break
+                pos = scan
 
-        if blob[pos:pos + 4] != b"KOVS":
-            found = False
-            scan = pos
-            while scan + 4 <= n:
-                if blob[scan:scan + 4] == b"KOVS":
-                    pos = scan
-                    found = True
+                if pos + 32 > n:
                     break
-                scan += 4
-            if not found:
+                size = KOVS_HEAD.unpack_from(blob, pos)[1]
+
+            if size <= 0:
                 break
 
-        if pos + 32 > n:
-            break
+            data_start = pos + 32
+            data_end = data_start + size
+            if data_end > n:
+                break
 
-        size = int.from_bytes(blob[pos + 4:pos + 8], "little", signed=False)
-        if size <= 0:
-            break
+            out_path = os.path.join(out_dir, f"{index:05d}.kvs")
+            chunk = view[pos:data_end]
+            chunks.append(chunk)
+            pending.append(MEMBER_WRITE_POOL.submit(write_unpacked_entry, out_path, chunk, b""))
+            chunk = None
+            if len(pending) >= UNPACK_QUEUE_LIMIT:
+                pool_result(pending.popleft())
+                chunks.popleft().release()
+
+            index += 1
+            # Next member starts on the next 16 byte boundary, a no-op when data_end is already aligned
+            pos = (data_end + 15) & ~0x0F
+
+        while pending:
+            pool_result(pending.popleft())
+            chunks.popleft().release()
+    finally:
+        settle_member_writes(pending)
+        for chunk in chunks:
+            chunk.release()
+        view.release()
 
-        data_start = pos + 32
-        data_end = data_start + size
-        if data_end > n:
-            break
+    return index > 0
 
-        chunk = blob[pos:data_end]
-        out_path = os.path.join(out_dir, f"{index:05d}.kvs")
-        with open(out_path, "wb") as fout:
-            fout.write(chunk)
 
-        index += 1
-        pos = data_end
-        if pos % 16 != 0:
-            pos = (pos + 15) & ~0x0F
+def unpack_kvs_file(path: str, out_dir: str) -> bool:
+    """
+    unpack_kvs_blob over a read-only map of path, so KOVS archives never get read whole into memory
+    Pages are faulted in as members are written, the working set is the members in flight
+    """
+    with open(path, "rb") as handle:
+        if handle.read(4) != b"KOVS":
+            return False
+        mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        advise_sequential_map(mm, handle.fileno())
+
+    try:
+        return unpack_kvs_blob(mm, out_dir)
+    finally:
+        # unpack_kvs_blob settles its member writes and releases their views, nothing pins the map here
+        mm.close()
 
-    return index > 0
 
 def looks_like_mdlk_blob(blob: bytes) -> bool:
     return len(blob) >= 16 and blob[:4] == b"MDLK"
@@ -1959,11 +2077,10 @@ def unpack_kshl_blob(blob: bytes, out_dir: str) -> bool:
         off = entry["offset"]
         size = entry["size"]
         ext = entry["ext"]
-        chunk = blob[off:off + size]
 
         out_path = os.path.join(out_dir, f"{idx:03d}{ext}")
-        with open(out_path, "wb") as fout:
-            fout.write(chunk)
+        with memoryview(blob) as view:
+            write_unpacked_entry(out_path, view[off:off + size], b"")
 
     return True
 
@@ -1992,7 +2109,11 @@ def patch_all_u32_le(buf: bytearray, start: int, end: int, old_value: int, new_v
     return patched
 
 
-def rebuild_kshl_blob_from_folder(folder_path: str, original_raw: bytes) -> bytes:
+def rebuild_kshl_blob_from_folder(
+    folder_path: str,
+    original_raw: bytes,
+    folder_files: list[str] | None = None,
+) -> bytes:
     """
     Rebuild KSHL by replacing the shader payload region and patching
         u32(0x08): KSHL size
@@ -2010,8 +2131,10 @@ def rebuild_kshl_blob_from_folder(folder_path: str, original_raw: bytes) -> byte
     if not layout:
         raise ValueError("Original file is not a recognized KSHL container.")
 
+    if folder_files is None:
+        folder_files = list_folder_payload_files(folder_path)
     payload_files = [
-        path for path in list_folder_payload_files(folder_path)
+        path for path in folder_files
         if os.path.splitext(path)[1].lower() in (".vsh", ".psh", ".dxbc", ".bin")
     ]
 
@@ -2023,10 +2146,7 @@ def rebuild_kshl_blob_from_folder(folder_path: str, original_raw: bytes) -> byte
         )
 
     chunks: list[bytes] = []
-    for path in payload_files:
-        with open(path, "rb") as handle:
-            chunk = handle.read()
-
+    for path, chunk in zip(payload_files, read_rebuild_chunks(payload_files, reader=read_file_bytes)):
         if not chunk:
             raise ValueError(f"{os.path.basename(path)} is empty.")
 
@@ -2103,11 +2223,11 @@ def rebuild_kshl_from_folder(
         looks_like_kshl_blob,
     )
 
-    rebuilt_raw = rebuild_kshl_blob_from_folder(folder_path, original_raw)
-    rebuilt_blob = rebuilt_raw + taildata_bytes
-
-    output_path = write_rebuilt_resource_output(original_kshl_path, rebuilt_blob, output_path)
-    return output_path, f"Rebuilt KSHL with {len(list_folder_payload_files(folder_path))} shader payload(s)."
+    # List the folder once, the same listing feeds the rebuild and the summary count
+    folder_files = list_folder_payload_files(folder_path)
+    rebuilt_raw = rebuild_kshl_blob_from_folder(folder_path, original_raw, folder_files)
+    output_path = write_rebuilt_resource_output(original_kshl_path, rebuilt_raw, output_path, taildata_bytes)
+    return output_path, f"Rebuilt KSHL with {len(folder_files)} shader payload(s)."
 
 def read_mdlk_layout(blob: bytes):
     """
@@ -2204,11 +2324,10 @@ def unpack_mdlk_blob(blob: bytes, out_dir: str) -> bool:
         off = entry["offset"]
         size = entry["size"]
         ext = entry["ext"]
-        chunk = blob[off:off + size]
 
         out_path = os.path.join(out_dir, f"{idx:03d}{ext}")
-        with open(out_path, "wb") as fout:
-            fout.write(chunk)
+        with memoryview(blob) as view:
+            write_unpacked_entry(out_path, view[off:off + size], b"")
 
     return True
 
@@ -2225,11 +2344,15 @@ def read_embedded_mdlk_layout(blob: bytes):
         if off < 0:
             break
 
-        layout = read_mdlk_layout(blob[off:])
-        if not layout:
+        # Probe through a view first so stray MDLK hits never copy the rest of blob
+        with memoryview(blob) as view:
+            probe = read_mdlk_layout(view[off:])
+        if not probe:
             search = off + 1
             continue
 
+        layout = read_mdlk_layout(blob[off:])
+
         payload_end = int(layout["payload_end"])
         if payload_end <= 16 or off + payload_end > len(blob):
             search = off + 1
@@ -2263,7 +2386,7 @@ def looks_like_embedded_mdlk_blob(blob: bytes) -> bool:
 
 def resolve_nested_payload_extension(chunk: bytes) -> str:
     inner_ext = detect_ext(chunk)
-    if inner_ext in (".ini", ".txt") and b"\x00" in chunk[:64]:
+    if inner_ext in (".ini", ".txt") and chunk.find(b"\x00", 0, 64) >= 0:
         return ".bin"
     if inner_ext != ".bin":
         return inner_ext
@@ -2288,8 +2411,7 @@ def unpack_embedded_mdlk_blob(blob: bytes, out_dir: str) -> bool:
         size = entry["size"]
         chunk = blob[off:off + size]
         out_path = os.path.join(out_dir, f"{idx:03d}.MDLK")
-        with open(out_path, "wb") as fout:
-            fout.write(chunk)
+        write_unpacked_entry(out_path, chunk, b"")
         unpack_nested_resource(out_path, blob=chunk)
 
     return True
@@ -2299,14 +2421,16 @@ def unpack_nested_resource(path: str, blob: bytes | None = None) -> bool:
     if not os.path.isfile(path):
         return False
 
-    if blob is None:
-        with open(path, "rb") as handle:
-            blob = handle.read()
-
     base_dir, fname = os.path.split(path)
     name_no_ext, _ = os.path.splitext(fname)
     out_dir = os.path.join(base_dir, name_no_ext)
 
+    if blob is None:
+        if unpack_kvs_file(path, out_dir):
+            return True
+        with open(path, "rb") as handle:
+            blob = handle.read()
+
     if unpack_kvs_blob(blob, out_dir):
         return True
     if unpack_mdlk_blob(blob, out_dir):
@@ -2331,11 +2455,8 @@ def split_optional_taildata(blob: bytes, detector) -> tuple[bytes, bytes]:
 
 
 def list_folder_payload_files(folder_path: str) -> list[str]:
-    folder_files = [
-        os.path.join(folder_path, name)
-        for name in os.listdir(folder_path)
-        if os.path.isfile(os.path.join(folder_path, name))
-    ]
+    with os.scandir(folder_path) as it:
+        folder_files = [entry.path for entry in it if entry.is_file()]
     folder_files.sort(key=subcontainer_file_sort_key)
     return folder_files
 
@@ -2390,26 +2511,33 @@ def rebuild_kvs_blob_from_folder(folder_path: str) -> bytes:
         raise ValueError("Selected KVS folder does not contain any .kvs files to rebuild.")
 
     rebuilt = bytearray()
-    for file_path in kvs_files:
-        with open(file_path, "rb") as handle:
-            chunk = handle.read()
-        if len(chunk) < 32 or chunk[:4] != b"KOVS":
+    for file_path, chunk in zip(kvs_files, read_rebuild_chunks(kvs_files, reader=read_file_bytes)):
+        if len(chunk) < 32:
+            raise ValueError(f"Invalid KVS chunk in folder rebuild: {os.path.basename(file_path)}")
+        magic, size = KOVS_HEAD.unpack_from(chunk)
+        if magic != b"KOVS":
             raise ValueError(f"Invalid KVS chunk in folder rebuild: {os.path.basename(file_path)}")
-        size = int.from_bytes(chunk[4:8], "little", signed=False)
         data_end = min(len(chunk), 32 + max(0, size))
-        rebuilt.extend(chunk[:data_end])
+        # Extend from a view so the kept prefix is copied once, straight into rebuilt
+        rebuilt.extend(memoryview(chunk)[:data_end])
         pad_len = (-len(rebuilt)) % 16
         if pad_len:
-            rebuilt.extend(b"\x00" * pad_len)
+            rebuilt.extend(zero_bytes(pad_len))
     return bytes(rebuilt)
 
-def rebuild_mdlk_blob_from_folder(folder_path: str, original_raw: bytes) -> bytes:
+def rebuild_mdlk_blob_from_folder(
+    folder_path: str,
+    original_raw: bytes,
+    folder_files: list[str] | None = None,
+) -> bytes:
     layout = read_mdlk_layout(original_raw)
     if not layout:
         raise ValueError("Original file is not a recognized MDLK container.")
 
+    if folder_files is None:
+        folder_files = list_folder_payload_files(folder_path)
     payload_files = [
-        path for path in list_folder_payload_files(folder_path)
+        path for path in folder_files
         if os.path.splitext(path)[1].lower() in (".g1m", ".g1c")
     ]
 
@@ -2426,10 +2554,8 @@ def rebuild_mdlk_blob_from_folder(folder_path: str, original_raw: bytes) -> byte
     rebuilt.extend(layout["unknown"])
     rebuilt.extend(layout["padd"])
 
-    for path, original_entry in zip(payload_files, layout["entries"]):
-        with open(path, "rb") as handle:
-            chunk = handle.read()
-
+    payload_chunks = read_rebuild_chunks(payload_files, reader=read_file_bytes)
+    for path, chunk in zip(payload_files, payload_chunks):
         if not chunk:
             raise ValueError(f"{os.path.basename(path)} is empty.")
 
@@ -2484,20 +2610,25 @@ def rebuild_mdlk_from_folder(
         looks_like_mdlk_blob,
     )
 
-    rebuilt_raw = rebuild_mdlk_blob_from_folder(folder_path, original_raw)
-    rebuilt_blob = rebuilt_raw + taildata_bytes
-
-    output_path = write_rebuilt_resource_output(original_mdlk_path, rebuilt_blob, output_path)
-    return output_path, f"Rebuilt MDLK with {len(list_folder_payload_files(folder_path))} payload(s)."
+    folder_files = list_folder_payload_files(folder_path)
+    rebuilt_raw = rebuild_mdlk_blob_from_folder(folder_path, original_raw, folder_files)
+    output_path = write_rebuilt_resource_output(original_mdlk_path, rebuilt_raw, output_path, taildata_bytes)
+    return output_path, f"Rebuilt MDLK with {len(folder_files)} payload(s)."
 
 
-def rebuild_embedded_mdlk_blob_from_folder(folder_path: str, original_raw: bytes) -> bytes:
+def rebuild_embedded_mdlk_blob_from_folder(
+    folder_path: str,
+    original_raw: bytes,
+    folder_files: list[str] | None = None,
+) -> bytes:
     layout = read_embedded_mdlk_layout(original_raw)
     if not layout:
         raise ValueError("Original file does not contain supported embedded MDLK resources.")
 
+    if folder_files is None:
+        folder_files = list_folder_payload_files(folder_path)
     payload_files = [
-        path for path in list_folder_payload_files(folder_path)
+        path for path in folder_files
         if os.path.splitext(path)[1].lower() == ".mdlk"
     ]
 
@@ -2510,12 +2641,12 @@ def rebuild_embedded_mdlk_blob_from_folder(folder_path: str, original_raw: bytes
 
     rebuilt = bytearray()
     cursor = 0
-    for path, entry in zip(payload_files, layout["entries"]):
+    payload_chunks = read_rebuild_chunks(payload_files)
+    for path, chunk, entry in zip(payload_files, payload_chunks, layout["entries"]):
         start = int(entry["offset"])
         end = start + int(entry["size"])
         rebuilt.extend(original_raw[cursor:start])
 
-        chunk = read_rebuild_chunk(path)
         if not looks_like_mdlk_blob(chunk):
             raise ValueError(f"{os.path.basename(path)} is not a recognized MDLK resource.")
 
@@ -2544,11 +2675,10 @@ def rebuild_embedded_mdlk_from_folder(
         looks_like_embedded_mdlk_blob,
     )
 
-    rebuilt_raw = rebuild_embedded_mdlk_blob_from_folder(folder_path, original_raw)
-    rebuilt_blob = rebuilt_raw + taildata_bytes
-
-    output_path = write_rebuilt_resource_output(original_resource_path, rebuilt_blob, output_path)
-    return output_path, f"Rebuilt embedded MDLK wrapper with {len(list_folder_payload_files(folder_path))} payload(s)."
+    folder_files = list_folder_payload_files(folder_path)
+    rebuilt_raw = rebuild_embedded_mdlk_blob_from_folder(folder_path, original_raw, folder_files)
+    output_path = write_rebuilt_resource_output(original_resource_path, rebuilt_raw, output_path, taildata_bytes)
+    return output_path, f"Rebuilt embedded MDLK wrapper with {len(folder_files)} payload(s)."
 
 
 def chunk_lists_match(left: list[bytes], right: list[bytes]) -> bool:
@@ -2664,7 +2794,7 @@ def rebuild_classic_split_zlib_raw_from_folder(folder_path: str, original_raw: b
             target_off = align_up(len(rebuilt), alignment)
             target_off += extra_gap_sizes[idx]
             if target_off > len(rebuilt):
-                rebuilt.extend(b"\x00" * (target_off - len(rebuilt)))
+                rebuilt.extend(zero_bytes(target_off - len(rebuilt)))
         elif idx < len(layout["between_gaps"]):
             rebuilt.extend(layout["between_gaps"][idx])
     rebuilt.extend(layout["trailing_gap"])
@@ -2672,19 +2802,24 @@ def rebuild_classic_split_zlib_raw_from_folder(folder_path: str, original_raw: b
     return bytes(rebuilt)
 
 
-def rebuild_split_zlib_wrapper_raw_from_folder(folder_path: str, original_raw: bytes) -> bytes:
+def rebuild_split_zlib_wrapper_raw_from_folder(
+    folder_path: str,
+    original_raw: bytes,
+    folder_files: list[str] | None = None,
+) -> bytes:
     layout = read_split_zlib_wrapper_layout(original_raw)
     if not layout:
         raise ValueError("Original file does not look like a split-zlib wrapper container.")
 
-    folder_files = list_folder_payload_files(folder_path)
+    if folder_files is None:
+        folder_files = list_folder_payload_files(folder_path)
     expected = len(layout["entries"])
     if len(folder_files) != expected:
         raise ValueError(
             f"Wrapper file count mismatch. Folder has {len(folder_files)} file(s), but the original wrapper has {expected} member(s)."
         )
 
-    chunks = [read_rebuild_chunk(file_path) for file_path in folder_files]
+    chunks = read_rebuild_chunks(folder_files)
     original_chunks = [
         original_raw[payload_off:payload_off + payload_size]
         for payload_off, payload_size in layout["entries"]
@@ -2692,9 +2827,8 @@ def rebuild_split_zlib_wrapper_raw_from_folder(folder_path: str, original_raw: b
     if chunk_lists_match(chunks, original_chunks):
         return original_raw
 
-    rebuilt = bytearray()
-    rebuilt.extend(int(expected).to_bytes(4, "little", signed=False))
-    rebuilt.extend(b"\x00" * (expected * 8))
+    # Count + zeroed TOC slots, the TOC is packed in one go once the offsets are known
+    rebuilt = bytearray(4 + expected * 8)
 
     cursor = len(rebuilt)
     rebuilt.extend(layout["leading_gap"])
@@ -2711,23 +2845,30 @@ def rebuild_split_zlib_wrapper_raw_from_folder(folder_path: str, original_raw: b
 
     rebuilt.extend(layout["trailing_gap"])
 
-    for idx, chunk in enumerate(chunks):
-        struct.pack_into("<I", rebuilt, 4 + idx * 8, offsets[idx])
-        struct.pack_into("<I", rebuilt, 8 + idx * 8, len(chunk))
+    toc_values = [expected]
+    for payload_off, chunk in zip(offsets, chunks):
+        toc_values.append(payload_off)
+        toc_values.append(len(chunk))
+    struct.pack_into(f"<{len(toc_values)}I", rebuilt, 0, *toc_values)
 
     return bytes(rebuilt)
 
 
-def rebuild_universal_subcontainer_raw_from_folder(folder_path: str, original_raw: bytes) -> bytes:
+def rebuild_universal_subcontainer_raw_from_folder(
+    folder_path: str,
+    original_raw: bytes,
+    folder_files: list[str] | None = None,
+) -> bytes:
     layout = read_universal_subcontainer_layout(original_raw)
     if not layout:
         raise ValueError("Original file does not look like a supported universal subcontainer.")
 
-    folder_files = list_folder_payload_files(folder_path)
+    if folder_files is None:
+        folder_files = list_folder_payload_files(folder_path)
     if not folder_files:
         raise ValueError("Selected subcontainer folder does not contain any files to rebuild.")
 
-    folder_chunks = [read_rebuild_chunk(file_path) for file_path in folder_files]
+    folder_chunks = read_rebuild_chunks(folder_files)
     for original_chunks in extract_original_layout_chunk_options(original_raw, layout):
         if chunk_lists_match(folder_chunks, original_chunks):
             return original_raw
@@ -2749,15 +2890,20 @@ def rebuild_universal_subcontainer_raw_from_folder(folder_path: str, original_ra
     return rebuild_subcontainer_raw_from_chunks(original_raw, layout, folder_chunks)
 
 
-def read_rebuild_chunk(file_path: str) -> bytes:
+def read_rebuild_chunk(file_path: str, nested_dirs: set[str] | None = None) -> bytes:
+    """
+    Read one payload file, rebuilding it from its sibling folder of the same stem when
+    one exists, nested_dirs (normcased sibling folder names) replaces the isdir check
+    """
     with open(file_path, "rb") as handle:
         blob = handle.read()
 
-    nested_folder = os.path.join(
-        os.path.dirname(file_path),
-        os.path.splitext(os.path.basename(file_path))[0],
-    )
-    if not os.path.isdir(nested_folder):
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    nested_folder = os.path.join(os.path.dirname(file_path), stem)
+    if nested_dirs is not None:
+        if os.path.normcase(stem) not in nested_dirs:
+            return blob
+    elif not os.path.isdir(nested_folder):
         return blob
 
     if looks_like_mdlk_blob(blob):
@@ -2785,7 +2931,40 @@ def read_rebuild_chunk(file_path: str) -> bytes:
     return blob
 
 
-def write_rebuilt_resource_output(original_resource_path: str, rebuilt_blob: bytes, output_path: str | None = None) -> str:
+def read_file_bytes(file_path: str) -> bytes:
+    with open(file_path, "rb") as handle:
+        return handle.read()
+
+
+def read_rebuild_chunks(file_paths: list[str], *, reader=None, max_workers: int = 4) -> list[bytes]:
+    """
+    reader (read_rebuild_chunk by default) for every path, in order
+
+    Payload files are independent so a few reader threads overlap their open/read
+    latency, the rebuild itself still consumes the chunks sequentially
+    """
+    if reader is None:
+        parents = {os.path.dirname(file_path) for file_path in file_paths}
+        if len(parents) == 1:
+            # One listing of the shared parent answers "has a nested folder" for every
+            # payload, instead of an isdir stat per file
+            with os.scandir(parents.pop()) as it:
+                nested_dirs = {os.path.normcase(entry.name) for entry in it if entry.is_dir()}
+            reader = lambda file_path: read_rebuild_chunk(file_path, nested_dirs)
+        else:
+            reader = read_rebuild_chunk
+    if len(file_paths) < 2:
+        return [reader(file_path) for file_path in file_paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(file_paths))) as pool:
+        return list(pool.map(reader, file_paths))
+
+
+def write_rebuilt_resource_output(
+    original_resource_path: str,
+    rebuilt_blob: bytes,
+    output_path: str | None = None,
+    taildata_bytes: bytes = b"",
+) -> str:
     if output_path is None:
         src_dir = os.path.dirname(original_resource_path)
         src_name = os.path.basename(original_resource_path)
@@ -2793,8 +2972,13 @@ def write_rebuilt_resource_output(original_resource_path: str, rebuilt_blob: byt
         output_path = os.path.join(src_dir, f"{base}_rebuilt{ext}")
     output_path = next_available_output_path(output_path)
 
+    # Taildata goes out as its own write rather than concatenated onto a copy of the whole blob
     with open(output_path, "wb") as handle:
+        # The final size is known, large outputs reserve it in one extent before writing
+        preallocate_output(handle.fileno(), len(rebuilt_blob) + len(taildata_bytes))
         handle.write(rebuilt_blob)
+        if taildata_bytes:
+            handle.write(taildata_bytes)
 
     return output_path
 
@@ -2810,8 +2994,7 @@ def rebuild_classic_split_zlib_from_folder(folder_path: str, original_resource_p
     original_raw, taildata_bytes = split_optional_taildata(original_blob, looks_like_classic_split_zlib)
 
     rebuilt_raw = rebuild_classic_split_zlib_raw_from_folder(folder_path, original_raw)
-    rebuilt_blob = rebuilt_raw + taildata_bytes
-    output_path = write_rebuilt_resource_output(original_resource_path, rebuilt_blob, output_path)
+    output_path = write_rebuilt_resource_output(original_resource_path, rebuilt_raw, output_path, taildata_bytes)
     return output_path, "Rebuilt classic split-zlib resource."
 
 
@@ -2825,10 +3008,10 @@ def rebuild_split_zlib_wrapper_from_folder(folder_path: str, original_resource_p
         original_blob = handle.read()
     original_raw, taildata_bytes = split_optional_taildata(original_blob, looks_like_split_zlib_pairtable_wrapper)
 
-    rebuilt_raw = rebuild_split_zlib_wrapper_raw_from_folder(folder_path, original_raw)
-    rebuilt_blob = rebuilt_raw + taildata_bytes
-    output_path = write_rebuilt_resource_output(original_resource_path, rebuilt_blob, output_path)
-    return output_path, f"Rebuilt split-zlib wrapper with {len(list_folder_payload_files(folder_path))} member(s)."
+    folder_files = list_folder_payload_files(folder_path)
+    rebuilt_raw = rebuild_split_zlib_wrapper_raw_from_folder(folder_path, original_raw, folder_files)
+    output_path = write_rebuilt_resource_output(original_resource_path, rebuilt_raw, output_path, taildata_bytes)
+    return output_path, f"Rebuilt split-zlib wrapper with {len(folder_files)} member(s)."
 
 
 def rebuild_subcontainer_from_folder(folder_path: str, original_subcontainer_path: str, output_path: str | None = None):
@@ -2844,10 +3027,10 @@ def rebuild_subcontainer_from_folder(folder_path: str, original_subcontainer_pat
         lambda raw: read_universal_subcontainer_layout(raw) is not None,
     )
 
-    rebuilt_raw = rebuild_universal_subcontainer_raw_from_folder(folder_path, original_raw)
-    rebuilt_blob = rebuilt_raw + taildata_bytes
-    output_path = write_rebuilt_resource_output(original_subcontainer_path, rebuilt_blob, output_path)
-    return output_path, f"Rebuilt subcontainer with {len(list_folder_payload_files(folder_path))} payload(s)."
+    folder_files = list_folder_payload_files(folder_path)
+    rebuilt_raw = rebuild_universal_subcontainer_raw_from_folder(folder_path, original_raw, folder_files)
+    output_path = write_rebuilt_resource_output(original_subcontainer_path, rebuilt_raw, output_path, taildata_bytes)
+    return output_path, f"Rebuilt subcontainer with {len(folder_files)} payload(s)."
 
 
 def normalize_endian(v: str) -> str:
@@ -2879,29 +3062,99 @@ def parse_idx_entry(chunk: bytes, raw_vars, field_size: int, endian: str):
     return values
 
 
-def unpack_from_schema(
-    schema: GameSchema,
-    base_dir: str,
-    status_callback=None,
-    progress_callback=None,
-):
+IDX_FIELD_CODES = {1: "B", 2: "H", 4: "I", 8: "Q"}
+
+
+def parse_idx_columns(idx_data: bytes, total_entries: int, entry_size: int, raw_vars, field_size: int, endian: str):
     """
-    Unpacker driven by an incode Aldnoah game schema plus a chosen base directory
+    Interpret every IDX entry at once, same field rules as parse_idx_entry
+
+    Returns dict: {var_name: sequence of int_value, one per entry}
     """
+    if not raw_vars or field_size <= 0 or total_entries <= 0:
+        return {}
+
+    names = list(raw_vars)[:entry_size // field_size]
+    if not names:
+        return {}
+
+    code = IDX_FIELD_CODES.get(field_size)
+    if code is None:
+        # Odd field widths have no struct code, decode them entry by entry from views of one buffer
+        idx_view = memoryview(idx_data)
+        rows = [
+            parse_idx_entry(idx_view[start:start + entry_size], names, field_size, endian)
+            for start in range(0, total_entries * entry_size, entry_size)
+        ]
+        return {name: [row[name] for row in rows] for name in names}
 
-    def update_status(text, color="blue"):
-        if status_callback is not None:
-            status_callback(text, color)
+    order = "<" if endian == "little" else ">"
+    count = len(names)
+    pad = entry_size - count * field_size
+    if pad == 0:
+        flat = struct.unpack_from(f"{order}{total_entries * count}{code}", idx_data)
+        return {name: flat[j::count] for j, name in enumerate(names)}
 
-    def update_progress(done, total, note=None):
-        if progress_callback is not None:
-            progress_callback(done, total, note)
+    row = struct.Struct(f"{order}{count}{code}{pad}x")
+    view = memoryview(idx_data)[:total_entries * entry_size]
+    return dict(zip(names, zip(*row.iter_unpack(view))))
 
-    game_name = schema.display_name or schema.game_id
-    containers = list(schema.containers)
-    idx_files = list(schema.idx_files)
-    out_root = schema.unpack_folder or "Unpacked_Files"
 
+def select_idx_read_spans(idx_columns: dict, total_entries: int, vars_to_shift, shift_bits: int):
+    """
+    Resolve the PC size_to_read rules for every IDX entry in one pass
+
+    Returns (offsets, sizes_to_read, flagged, original_sizes), size_to_read is 0 for dummy and non-physical entries
+    """
+    columns = dict(idx_columns)
+    if shift_bits:
+        for name in vars_to_shift:
+            if name in columns:
+                columns[name] = [value << shift_bits for value in columns[name]]
+
+    zeros = [0] * total_entries
+
+    def column(*names):
+        for name in names:
+            values = columns.get(name)
+            if values is not None:
+                return values
+        return zeros
+
+    offsets = column("Offset")
+    original_sizes = column("Original_Size", "Full_Size")
+    compressed_sizes = column("Compressed_Size")
+    flags = column("Compression_Marker")
+
+    flagged = [c > 0 and flag == 1 for c, flag in zip(compressed_sizes, flags)]
+    # compressed_sz == 0 covers both genuine dummies and non-physical entries
+    sizes = [
+        (c if is_flagged else o) if c else 0
+        for o, c, is_flagged in zip(original_sizes, compressed_sizes, flagged)
+    ]
+    return offsets, sizes, flagged, original_sizes
+
+
+@dataclass(frozen=True)
+class UnpackPlan:
+    """
+    IDX layout and compression settings resolved once from a GameSchema
+    """
+    entry_size: int
+    field_size: int
+    raw_vars: tuple[str, ...]
+    vars_to_shift: tuple[str, ...]
+    shift_bits: int
+    endian: str
+    compression_list: tuple[str, ...]
+    start_from_offset: int
+    has_start_from: bool
+
+
+def build_unpack_plan(schema: GameSchema) -> UnpackPlan:
+    """
+    Resolve entry size, shift targets, endian and compression for every pair of an unpack
+    """
     raw_vars = list(schema.raw_variables)
     field_size = int(schema.field_size or 0)
     entry_size_cfg = int(schema.idx_chunk_read or 0)
@@ -2937,11 +3190,72 @@ def unpack_from_schema(
     endian = normalize_endian(schema.endian)
 
     compression_cfg = str(schema.compression or "auto")
-    compression_list = [compression_cfg] * max(1, len(idx_files))
+    compression_list = [compression_cfg] * max(1, len(schema.idx_files))
 
     start_from_offset = int(schema.start_from_offset or 0)
     has_start_from = start_from_offset > 0
 
+    return UnpackPlan(
+        entry_size=entry_size,
+        field_size=field_size,
+        raw_vars=tuple(raw_vars),
+        vars_to_shift=tuple(vars_to_shift),
+        shift_bits=shift_bits,
+        endian=endian,
+        compression_list=tuple(compression_list),
+        start_from_offset=start_from_offset,
+        has_start_from=has_start_from,
+    )
+
+
+# Seconds between forwarded progress updates, every one of them is a hop onto the GUI thread
+PROGRESS_INTERVAL = 1 / 30
+
+
+def unpack_from_schema(
+    schema: GameSchema,
+    base_dir: str,
+    status_callback=None,
+    progress_callback=None,
+):
+    """
+    Unpacker driven by an incode Aldnoah game schema plus a chosen base directory
+    """
+
+    def update_status(text, color="blue"):
+        if status_callback is not None:
+            status_callback(text, color)
+
+    last_progress = 0.0
+    held_progress = None
+
+    def update_progress(done, total, note=None):
+        nonlocal last_progress, held_progress
+        if progress_callback is None:
+            return
+        # The GUI sees about 30 updates a second, anything gated out is held for flush_progress
+        now = time.monotonic()
+        if done == 0 or done >= total or now - last_progress >= PROGRESS_INTERVAL:
+            last_progress = now
+            held_progress = None
+            progress_callback(done, total, note)
+        else:
+            held_progress = (done, total, note)
+
+    def flush_progress():
+        # A pack can end on skipped entries and never report done == total, show its latest state anyway
+        nonlocal held_progress
+        if held_progress is not None:
+            progress_callback(*held_progress)
+            held_progress = None
+
+    game_name = schema.display_name or schema.game_id
+    containers = list(schema.containers)
+    idx_files = list(schema.idx_files)
+    out_root = schema.unpack_folder or "Unpacked_Files"
+
+    plan = build_unpack_plan(schema)
+
     if not containers or not idx_files:
         update_status("No containers or IDX files are defined in the selected schema.", "red")
         return
@@ -2950,7 +3264,7 @@ def unpack_from_schema(
         os.makedirs(out_root, exist_ok=True)
 
     update_status(
-        f"Unpacking {game_name} (entry size: {entry_size} bytes, schema-driven)",
+        f"Unpacking {game_name} (entry size: {plan.entry_size} bytes, schema-driven)",
         "blue",
     )
 
@@ -2973,23 +3287,19 @@ def unpack_from_schema(
             update_status("No valid containers found for single-IDX mode.", "red")
             return
 
-        unpack_multi_containers(
-            bin_paths,
-            idx_path,
-            out_root,
-            entry_size,
-            raw_vars,
-            field_size,
-            update_status,
-            update_progress,
-            vars_to_shift,
-            shift_bits,
-            start_from_offset,
-            has_start_from,
-            idx_marker=0,
-            endian=endian,
-            compression_kind=compression_list[0],
-        )
+        try:
+            unpack_multi_containers(
+                bin_paths,
+                idx_path,
+                out_root,
+                plan,
+                update_status,
+                update_progress,
+                idx_marker=0,
+                compression_kind=plan.compression_list[0],
+            )
+        finally:
+            flush_progress()
 
     # Normal 1:1 pairing
     elif len(containers) == len(idx_files):
@@ -3009,29 +3319,26 @@ def unpack_from_schema(
             pair_out_dir = os.path.join(out_root, f"Pack_{pair_index:02d}")
             os.makedirs(pair_out_dir, exist_ok=True)
 
+            compression_list = plan.compression_list
             compression_kind = (
                 compression_list[pair_index]
                 if pair_index < len(compression_list)
                 else compression_list[-1]
             )
 
-            unpack_pair(
-                bin_path,
-                idx_path,
-                pair_out_dir,
-                entry_size,
-                raw_vars,
-                field_size,
-                update_status,
-                update_progress,
-                vars_to_shift,
-                shift_bits,
-                start_from_offset,
-                has_start_from,
-                idx_marker=pair_index,
-                endian=endian,
-                compression_kind=compression_kind,
-            )
+            try:
+                unpack_pair(
+                    bin_path,
+                    idx_path,
+                    pair_out_dir,
+                    plan,
+                    update_status,
+                    update_progress,
+                    idx_marker=pair_index,
+                    compression_kind=compression_kind,
+                )
+            finally:
+                flush_progress()
 
     else:
         update_status(
@@ -3044,47 +3351,359 @@ def unpack_from_schema(
     update_status(f"Finished unpacking {game_name}.", "green")
 
 
-def append_taildata(
-    out_path: str,
+# One pack call per entry instead of three tiny bytes objects and their concatenation
+TAILDATA_LE = struct.Struct("<BIB")
+TAILDATA_BE = struct.Struct(">BIB")
+
+
+def build_taildata(
     idx_marker: int,
     entry_off: int,
     comp_marker: int,
     endian: str,
-):
+) -> bytes:
     """
     Taildata: 1 byte idx_marker, 4 byte entry_offset (endian from ref), 1 byte compression_marker
     comp_marker: 0x01 only if decompression actually occurred else 0x00
     """
+    packer = TAILDATA_LE if endian == "little" else TAILDATA_BE
     try:
-        with open(out_path, "ab") as f:
-            f.write(bytes([idx_marker & 0xFF]))
-            f.write(int(entry_off).to_bytes(4, endian, signed=False))
-            f.write(bytes([comp_marker & 0xFF]))
+        return packer.pack(idx_marker & 0xFF, int(entry_off), comp_marker & 0xFF)
     except Exception:
-        pass
+        return b""
+
+
+# Only outputs well above typical entry size are reserved, smaller ones would each pay an extent conversion
+# (and a byte per block where glibc emulates fallocate) for no layout gain
+UNPACK_PREALLOC_MIN = 8 * 1024 * 1024
+# Cleared on the first failure, a filesystem without fallocate support is not asked again for every file
+preallocate_enabled = hasattr(os, "posix_fallocate")
+
+
+def open_output_dir(path: str) -> int | None:
+    """
+    Directory fd for writing many entries into path by bare name, so each open skips walking path again
+    None where os.open has no dir_fd support (Windows) or the directory cannot be opened
+    """
+    if os.open not in os.supports_dir_fd:
+        return None
+    try:
+        return os.open(path, os.O_RDONLY | getattr(os, "O_DIRECTORY", 0))
+    except OSError:
+        return None
+
+
+def preallocate_output(fd: int, size: int) -> None:
+    """
+    Reserve size bytes for a freshly created output in one extent, where the OS supports it
+    Outputs below UNPACK_PREALLOC_MIN are left to the normal write path
+    """
+    global preallocate_enabled
+    if not preallocate_enabled or size < UNPACK_PREALLOC_MIN:
+        return
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except OSError:
+        preallocate_enabled = False
+
+
+def write_unpacked_entry(out_path: str, data: bytes, tail: bytes, dir_fd: int | None = None) -> None:
+    """
+    Create out_path holding data followed by its taildata
+    Uses one gathered writev where the OS has it, two writes on the same handle otherwise
+    With dir_fd (from open_output_dir) out_path is a bare name inside that directory
+    """
+    if not hasattr(os, "writev"):
+        with open(out_path, "wb", opener=lambda path, flags: os.open(path, flags, 0o666, dir_fd=dir_fd)) as fout:
+            fout.write(data)
+            fout.write(tail)
+        return
+
+    # 0o666 so the umask decides the final mode, same as open()
+    fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd)
+    try:
+        # Large entries reserve their extent first so the write itself does no block allocation
+        preallocate_output(fd, len(data) + len(tail))
+        writev_all(fd, [memoryview(data), memoryview(tail)])
+    finally:
+        os.close(fd)
+
+
+def writev_all(fd: int, buffers: list) -> None:
+    while buffers:
+        written = os.writev(fd, buffers)
+        # Short writes are legal, drop what landed and resend the rest
+        while buffers and written >= len(buffers[0]):
+            written -= len(buffers.pop(0))
+        if buffers and written:
+            buffers[0] = buffers[0][written:]
+
+
+# Passthrough entries at least this large are copied container to output inside the kernel
+UNPACK_COPY_RANGE_MIN = 256 * 1024
+
+
+def copy_unpacked_entry(
+    out_path: str,
+    src_fd: int,
+    src_offset: int,
+    data: bytes,
+    tail: bytes,
+    dir_fd: int | None = None,
+) -> None:
+    """
+    Passthrough variant of write_unpacked_entry, copy_file_range moves the entry bytes straight
+    from the container (page to page, or a reflink where the filesystem supports it)
+    data is only written from if the kernel copy stops short or is refused
+    """
+    size = len(data)
+    fd = os.open(out_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666, dir_fd=dir_fd)
+    try:
+        copied = 0
+        try:
+            while copied < size:
+                # offset_src leaves the shared container fd's position alone, so workers can't collide
+                count = os.copy_file_range(src_fd, fd, size - copied, offset_src=src_offset + copied)
+                if count <= 0:
+                    break
+                copied += count
+        except OSError:
+            pass
+        writev_all(fd, [memoryview(data)[copied:], memoryview(tail)])
+    finally:
+        os.close(fd)
+
+
+# Consumed container pages are handed back to the kernel in spans this large
+UNPACK_RELEASE_SPAN = 64 * 1024 * 1024
+
+
+def advise_sequential_map(mm, fd: int) -> None:
+    # IDX entries are laid out in offset order, let readahead run ahead of the walk
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    # The map hint does not cover copy_file_range reads through fd, those follow the file's own readahead
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+
+
+def release_mapped_pages(mm, start: int, end: int) -> int:
+    """
+    Drop the already copied map range [start, end) so RSS stays flat on multi-GB containers
+
+    Returns the page aligned position released up to, pass it back in as the next start
+    """
+    end -= end % mmap.PAGESIZE
+    if end <= start:
+        return start
+    if hasattr(mmap, "MADV_DONTNEED"):
+        mm.madvise(mmap.MADV_DONTNEED, start, end - start)
+    return end
+
+
+# Kinds that inflate as zlib_header unless the entry structurally looks like split zlib
+MIXED_ZLIB_KINDS = (
+    "zlib_header",
+    "ozlib",
+    "omega_zlib",
+    "zlib",
+    "auto",
+    "pc_mixed",
+)
+SPLIT_AWARE_KINDS = ("zlib_split", "omega_split") + MIXED_ZLIB_KINDS
+
+# zlib inflate releases the GIL so entries decode in parallel, the queue is capped to bound RAM
+UNPACK_WORKERS = os.cpu_count() or 1
+UNPACK_QUEUE_LIMIT = UNPACK_WORKERS * 2
+# Queued entries are also capped by their expected decoded size, a many-core box otherwise holds dozens of
+# inflated textures at once just to keep the progress bar moving
+UNPACK_QUEUE_BYTES = 64 * 1024 * 1024
+
+# Nested member writes share one long lived pool, nested containers would otherwise spin up threads per blob
+# Only write_unpacked_entry runs on it, so callers waiting on it can never deadlock each other
+MEMBER_WRITE_POOL = ThreadPoolExecutor(max_workers=UNPACK_WORKERS, thread_name_prefix="aldnoah-write")
+
+
+def settle_member_writes(pending) -> None:
+    """Cancel queued member writes and wait out running ones, so none outlive an error"""
+    for future in pending:
+        future.cancel()
+    wait(pending)
+
+
+def inflate_zlib_header(raw, expected_size: int = 0) -> bytes:
+    """
+    One-shot inflate of a 4 byte size + zlib stream at offset 0, output buffer presized from the IDX size
+    Anything else takes codec_decompress's zlib_header path and its header scan
+    """
+    if len(raw) >= 6:
+        size0 = u32_le(raw, 0)
+        if size0 > 0 and 4 + size0 <= len(raw):
+            bufsize = zlib.DEF_BUF_SIZE
+            if expected_size > 0:
+                # Deflate tops out near 1032:1, so a bogus IDX size can't force a huge allocation
+                bufsize = min(expected_size, size0 * 1032 + 64)
+            try:
+                return zlib.decompress(raw[4:4 + size0], bufsize=bufsize)
+            except zlib.error:
+                pass
+    return codec_decompress(raw, "zlib_header")
+
+
+def decode_idx_entry_payload(raw, flagged: bool, compression_kind: str, expected_size: int = 0):
+    """
+    Decompress one IDX entry payload and resolve its extension
+
+    raw may be a memoryview over the container map, data always comes back as bytes
+    expected_size is the entry's IDX original size, used only to presize zlib_header output
+    Returns (data, ext, did_decompress, failure), failure is None or (label, error text)
+    Only touches the buffer it is given so it is safe to run on a worker thread
+    """
+    # zlib_header inflates straight from the view, every other path needs its own bytes copy
+    if not (flagged and compression_kind in MIXED_ZLIB_KINDS and not may_be_split_zlib(raw)):
+        raw = bytes(raw)
+
+    data = raw
+    ext_hint = None
+    did_decompress = False
+    failure = None
+
+    # PC compressed (flag==1)
+    if flagged:
+        try:
+            # If explicitly says split force split first
+            if compression_kind in ("zlib_split", "omega_split"):
+                try:
+                    prepared = try_prepare_split_zlib_entry(raw)
+                except Exception:
+                    prepared = None
+                if prepared is None:
+                    # fallback to omega zlib_header
+                    data = codec_decompress(raw, "zlib_header")
+                    did_decompress = True
+                else:
+                    data, ext_hint, did_decompress = prepared
+
+            # If ref says zlib_header/zlib/auto, allow mixed PC behavior:
+            # split if it structurally looks like split else header
+            elif compression_kind in MIXED_ZLIB_KINDS:
+                try:
+                    prepared = try_prepare_split_zlib_entry(raw)
+                except Exception:
+                    data = codec_decompress(raw, "zlib_header")
+                    did_decompress = True
+                else:
+                    if prepared is None:
+                        data = inflate_zlib_header(raw, expected_size)
+                        did_decompress = True
+                    else:
+                        data, ext_hint, did_decompress = prepared
+
+            # none/raw means really don't decompress
+            elif compression_kind in ("none", "raw"):
+                data = raw
+
+            # Any other explicit kind (lzma/gzip/etc)
+            else:
+                data = codec_decompress(raw, compression_kind)
+                did_decompress = True
+
+        except Exception as e:
+            failure = (f"{compression_kind} decompress failed", str(e))
+            data = bytes(raw)
+            ext_hint = None
+            did_decompress = False
+
+    # Some PC split-zlib containers are not flagged as compressed
+    elif compression_kind in SPLIT_AWARE_KINDS:
+        try:
+            prepared = try_prepare_split_zlib_entry(raw)
+        except Exception as e:
+            failure = ("split-zlib fallback failed", str(e))
+            data = raw
+        else:
+            if prepared is not None:
+                data, ext_hint, did_decompress = prepared
+
+    return data, resolve_unpacked_extension(data, ext_hint), did_decompress, failure
+
+
+def unpack_idx_entry_to_file(
+    raw,
+    flagged: bool,
+    compression_kind: str,
+    expected_size: int,
+    out_dir: str,
+    local_index: int,
+    idx_marker: int,
+    entry_off: int,
+    endian: str,
+    src_fd: int | None = None,
+    src_offset: int = 0,
+    out_dir_fd: int | None = None,
+):
+    """
+    Worker side of the IDX unpackers, decodes one entry and writes out_dir/entry_NNNNN.ext with its taildata
+    src_fd/src_offset locate the entry in its container so large passthrough entries can be copied by the kernel
+    out_dir_fd is out_dir opened with open_output_dir, entries are then created relative to it
+
+    Returns (out_path, out_name, data, failure), each worker writes through its own file descriptor
+    """
+    data, ext, did_decompress, failure = decode_idx_entry_payload(raw, flagged, compression_kind, expected_size)
+
+    out_name = f"entry_{local_index:05d}{ext}"
+    out_path = os.path.join(out_dir, out_name)
+    tail = build_taildata(
+        idx_marker,
+        entry_off,
+        1 if did_decompress else 0,
+        endian,
+    )
+    target = out_path if out_dir_fd is None else out_name
+    # Without decompression data is byte for byte the container range
+    if (
+        not did_decompress
+        and src_fd is not None
+        and len(data) >= UNPACK_COPY_RANGE_MIN
+        and hasattr(os, "copy_file_range")
+    ):
+        copy_unpacked_entry(target, src_fd, src_offset, data, tail, out_dir_fd)
+    else:
+        write_unpacked_entry(target, data, tail, out_dir_fd)
+    return out_path, out_name, data, failure
+
+
+def pool_result(future):
+    """
+    Result of a queued entry or member write, a worker error is re-raised without the worker's frames
+    Those frames hold views into the source map, and the map cannot close while they live
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        raise e.with_traceback(None)
 
 
 def unpack_pair(
     bin_path,
     idx_path,
     pair_out_dir,
-    entry_size,
-    raw_vars,
-    field_size,
+    plan: UnpackPlan,
     update_status,
     update_progress,
-    vars_to_shift,
-    shift_bits,
-    start_from_offset,
-    has_start_from,
     *,
     idx_marker: int,
-    endian: str,
     compression_kind: str,
 ):
     """
     Unpack a single BIN/IDX pair
     """
+    entry_size = plan.entry_size
+    start_from_offset = plan.start_from_offset
+    endian = plan.endian
 
     update_status(f"Reading IDX: {os.path.basename(idx_path)}", "blue")
 
@@ -3096,7 +3715,7 @@ def unpack_pair(
         return
 
     # If Start_From_Offset present use it else use full IDX
-    if has_start_from and start_from_offset > 0:
+    if plan.has_start_from and start_from_offset > 0:
         if start_from_offset >= len(idx_data_full):
             update_status(
                 f"Start_From_Offset {start_from_offset} is beyond IDX size "
@@ -3104,7 +3723,8 @@ def unpack_pair(
                 "red",
             )
             return
-        idx_data = idx_data_full[start_from_offset:]
+        # View from Start_From_Offset on, slicing the bytes would copy the whole IDX
+        idx_data = memoryview(idx_data_full)[start_from_offset:]
     else:
         idx_data = idx_data_full
         start_from_offset = 0  # important so taildata math stays correct
@@ -3119,187 +3739,125 @@ def unpack_pair(
     total_entries = len(idx_data) // entry_size
     update_status(f"IDX entries: {total_entries}", "blue")
 
+    bin_name = os.path.basename(bin_path)
+
     if update_progress is not None:
         update_progress(
             0,
             total_entries,
-            f"{os.path.basename(bin_path)}: starting…",
+            f"{bin_name}: starting…",
         )
 
     compression_kind = str(compression_kind or "auto").lower()
+    idx_columns = parse_idx_columns(idx_data, total_entries, entry_size, plan.raw_vars, plan.field_size, endian)
+    offsets, sizes_to_read, flagged_entries, original_sizes = select_idx_read_spans(
+        idx_columns, total_entries, plan.vars_to_shift, plan.shift_bits
+    )
 
-    with open(bin_path, "rb") as f_bin:
-        mm = mmap.mmap(f_bin.fileno(), 0, access=mmap.ACCESS_READ)
-        try:
-            file_index = 0
-
-            for i in range(total_entries):
-                start = i * entry_size
-                end = start + entry_size
-                chunk = idx_data[start:end]
-                if len(chunk) < entry_size:
-                    continue
-
-                vals = parse_idx_entry(chunk, raw_vars, field_size, endian)
+    log_root = os.path.dirname(pair_out_dir)
 
-                if shift_bits:
-                    for name in vars_to_shift:
-                        if name in vals:
-                            vals[name] = vals[name] << shift_bits
+    def finish_entry(future, i, offset, size_to_read):
+        out_path, out_name, data, failure = pool_result(future)
 
-                offset = vals.get("Offset", 0)
-                original_sz = vals.get("Original_Size", vals.get("Full_Size", 0))
-                compressed_sz = vals.get("Compressed_Size", 0)
-                flag = vals.get("Compression_Marker", 0)
+        unpack_nested_resource(out_path, blob=data)
 
-                if original_sz == 0 and compressed_sz == 0:
-                    # genuine dummy
-                    continue
+        if failure is not None:
+            label, error = failure
+            msg = (
+                f"{label} at IDX entry {i} "
+                f"(BIN={bin_name}, "
+                f"offset=0x{offset:X}, size=0x{size_to_read:X}): {error}"
+                f"; wrote raw to {out_name}"
+            )
+            log_comp_failure(log_root, msg)
+
+        if update_progress is not None:
+            if (i & 31) == 0 or i + 1 == total_entries:
+                update_progress(
+                    i + 1,
+                    total_entries,
+                    f"{bin_name}: "
+                    f"{i + 1}/{total_entries}",
+                )
 
-                # PC only size_to_read selection
-                if compressed_sz == 0:
-                    # Skip non-physical entries
-                    continue
+    pending = deque()
+    queued_sizes = deque()
+    queued_bytes = 0
 
-                size_to_read = original_sz
-                if compressed_sz > 0 and flag == 1:
-                    size_to_read = compressed_sz
+    with open(bin_path, "rb") as f_bin, ThreadPoolExecutor(max_workers=UNPACK_WORKERS) as pool:
+        mm = mmap.mmap(f_bin.fileno(), 0, access=mmap.ACCESS_READ)
+        mv = memoryview(mm)
+        raw = None
+        out_dir_fd = None
+        try:
+            advise_sequential_map(mm, f_bin.fileno())
+            out_dir_fd = open_output_dir(pair_out_dir)
+            released = 0
+            map_len = len(mm)
+            file_index = 0
 
-                if size_to_read <= 0:
-                    continue
+            # Entries with nothing to read are filtered out before the loop body runs
+            for i in compress(range(total_entries), sizes_to_read):
+                start = i * entry_size
+                offset = offsets[i]
+                size_to_read = sizes_to_read[i]
 
-                if offset + size_to_read > len(mm):
+                if offset + size_to_read > map_len:
                     update_status(
                         f"Entry {i} out of range "
                         f"(offset=0x{offset:X}, size=0x{size_to_read:X}) "
-                        f"in {os.path.basename(bin_path)}; skipping.",
+                        f"in {bin_name}; skipping.",
                         "red",
                     )
                     continue
 
-                raw = mm[offset:offset + size_to_read]
-
-                data = raw
-                ext_hint = None
-                used_raw = False
-                raw_error = None
-                did_decompress = False
-
-                # PC compressed (flag==1)
-                if compressed_sz > 0 and flag == 1:
-                    try:
-                        # If explicitly says split force split first
-                        if compression_kind in ("zlib_split", "omega_split"):
-                            try:
-                                data, ext_hint, did_decompress = prepare_split_zlib_entry_for_unpack(raw)
-                            except Exception:
-                                # fallback to omega zlib_header
-                                data = codec_decompress(raw, "zlib_header")
-                                did_decompress = True
-
-                        # If ref says zlib_header/zlib/auto, allow mixed PC behavior:
-                        # split if it structurally looks like split else header
-                        elif compression_kind in (
-                            "zlib_header",
-                            "ozlib",
-                            "omega_zlib",
-                            "zlib",
-                            "auto",
-                            "pc_mixed",
-                        ):
-                            if looks_like_split_zlib(raw):
-                                try:
-                                    data, ext_hint, did_decompress = prepare_split_zlib_entry_for_unpack(raw)
-                                except Exception:
-                                    data = codec_decompress(raw, "zlib_header")
-                                    did_decompress = True
-                            else:
-                                data = codec_decompress(raw, "zlib_header")
-                                did_decompress = True
-
-                        # none/raw means really don't decompress
-                        elif compression_kind in ("none", "raw"):
-                            data = raw
-
-                        # Any other explicit kind (lzma/gzip/etc)
-                        else:
-                            data = codec_decompress(raw, compression_kind)
-                            did_decompress = True
-
-                    except Exception as e:
-                        used_raw = True
-                        raw_error = (
-                            f"{compression_kind} decompress failed at IDX entry {i} "
-                            f"(BIN={os.path.basename(bin_path)}, "
-                            f"offset=0x{offset:X}, size=0x{size_to_read:X}): {e}"
-                        )
-                        data = raw
-
-                else:
-                    # Uncompressed/non-flagged entries
-
-                    # Some PC split-zlib containers are not flagged as compressed
-                    if compression_kind in (
-                        "zlib_split",
-                        "omega_split",
-                        "zlib_header",
-                        "ozlib",
-                        "omega_zlib",
-                        "zlib",
-                        "auto",
-                        "pc_mixed",
-                    ) and looks_like_split_zlib(raw):
-                        try:
-                            data, ext_hint, did_decompress = prepare_split_zlib_entry_for_unpack(raw)
-                        except Exception as e:
-                            used_raw = True
-                            raw_error = (
-                                f"split-zlib fallback failed at IDX entry {i} "
-                                f"(BIN={os.path.basename(bin_path)}, "
-                                f"offset=0x{offset:X}, size=0x{size_to_read:X}): {e}"
-                            )
-                            data = raw
-
-                ext = resolve_unpacked_extension(data, ext_hint)
-
-                out_name = f"entry_{file_index:05d}{ext}"
-                out_path = os.path.join(pair_out_dir, out_name)
-
-                with open(out_path, "wb") as fout:
-                    fout.write(data)
-
+                # A view, not a copy, the worker decides whether the entry needs its own bytes
+                raw = mv[offset:offset + size_to_read]
                 # Taildata wants the absolute entry offset in the IDX file
-                entry_off_abs = start_from_offset + start
-                append_taildata(
-                    out_path,
-                    idx_marker,
-                    entry_off_abs,
-                    1 if did_decompress else 0,
-                    endian,
-                )
+                pending.append((
+                    pool.submit(
+                        unpack_idx_entry_to_file,
+                        raw,
+                        flagged_entries[i],
+                        compression_kind,
+                        original_sizes[i],
+                        pair_out_dir,
+                        file_index,
+                        idx_marker,
+                        start_from_offset + start,
+                        endian,
+                        f_bin.fileno(),
+                        offset,
+                        out_dir_fd,
+                    ),
+                    i, offset, size_to_read,
+                ))
+                file_index += 1
 
-                unpack_nested_resource(out_path, blob=data)
+                if offset - released >= UNPACK_RELEASE_SPAN:
+                    released = release_mapped_pages(mm, released, offset)
 
-                file_index += 1
+                entry_bytes = max(size_to_read, original_sizes[i])
+                queued_sizes.append(entry_bytes)
+                queued_bytes += entry_bytes
+                while pending and (len(pending) >= UNPACK_QUEUE_LIMIT or queued_bytes > UNPACK_QUEUE_BYTES):
+                    queued_bytes -= queued_sizes.popleft()
+                    finish_entry(*pending.popleft())
 
-                if used_raw and raw_error:
-                    msg = f"{raw_error}; wrote raw to {out_name}"
-                    log_root = os.path.dirname(pair_out_dir)
-                    log_comp_failure(log_root, msg)
-
-                if update_progress is not None:
-                    if (i & 31) == 0 or i + 1 == total_entries:
-                        update_progress(
-                            i + 1,
-                            total_entries,
-                            f"{os.path.basename(bin_path)}: "
-                            f"{i + 1}/{total_entries}",
-                        )
+            while pending:
+                finish_entry(*pending.popleft())
         finally:
+            # Every view into the map has to be gone before it can close
+            pool.shutdown(wait=True, cancel_futures=True)
+            pending.clear()
+            if out_dir_fd is not None:
+                os.close(out_dir_fd)
+            raw = None
+            mv.release()
             mm.close()
 
     update_status(
-        f"Unpacked {total_entries} IDX entries from {os.path.basename(bin_path)}",
+        f"Unpacked {total_entries} IDX entries from {bin_name}",
         "green",
     )
 
@@ -3308,24 +3866,20 @@ def unpack_multi_containers(
     bin_paths,
     idx_path,
     out_root,
-    entry_size,
-    raw_vars,
-    field_size,
+    plan: UnpackPlan,
     update_status,
     update_progress,
-    vars_to_shift,
-    shift_bits,
-    start_from_offset,
-    has_start_from,
     *,
     idx_marker: int,
-    endian: str,
     compression_kind: str,
 ):
     """
     Single IDX describing data spread across multiple containers
     Taildata is appended to each output file
     """
+    entry_size = plan.entry_size
+    start_from_offset = plan.start_from_offset
+    endian = plan.endian
 
     if not bin_paths:
         update_status("No container paths provided for multi-container unpack.", "red")
@@ -3343,7 +3897,7 @@ def unpack_multi_containers(
         update_status("Invalid entry_size; must be > 0.", "red")
         return
 
-    if has_start_from and start_from_offset > 0:
+    if plan.has_start_from and start_from_offset > 0:
         if start_from_offset >= len(idx_data_full):
             update_status(
                 f"Start_From_Offset {start_from_offset} is beyond IDX size "
@@ -3351,7 +3905,8 @@ def unpack_multi_containers(
                 "red",
             )
             return
-        idx_data = idx_data_full[start_from_offset:]
+        # View from Start_From_Offset on, slicing the bytes would copy the whole IDX
+        idx_data = memoryview(idx_data_full)[start_from_offset:]
     else:
         idx_data = idx_data_full
         start_from_offset = 0
@@ -3370,6 +3925,10 @@ def unpack_multi_containers(
         update_progress(0, total_entries, "Multi-container IDX: starting…")
 
     compression_kind = str(compression_kind or "auto").lower()
+    idx_columns = parse_idx_columns(idx_data, total_entries, entry_size, plan.raw_vars, plan.field_size, endian)
+    offsets, sizes_to_read, flagged_entries, original_sizes = select_idx_read_spans(
+        idx_columns, total_entries, plan.vars_to_shift, plan.shift_bits
+    )
 
     # map all containers
     bin_files = []
@@ -3382,6 +3941,7 @@ def unpack_multi_containers(
         except OSError:
             update_status(f"Could not open or mmap container: {p}", "red")
             continue
+        advise_sequential_map(mm, f.fileno())
         bin_files.append(f)
         bin_maps.append(mm)
         bin_sizes.append(len(mm))
@@ -3392,209 +3952,164 @@ def unpack_multi_containers(
         )
         return
 
+    # Container basenames for messages, computed once instead of per entry
+    bin_names = [os.path.basename(p) for p in bin_paths]
+    # Pre-pass: replay the offset-reset and overflow rules once so every readable entry
+    # carries its own (container, local index) and the main loop needs no container state
     container_counts = [0] * len(bin_files)
+    entry_plan = []
     current_idx = 0
-    current_map = bin_maps[current_idx]
     current_size = bin_sizes[current_idx]
     def advance_container():
-        nonlocal current_idx, current_map, current_size
+        nonlocal current_idx, current_size
         if current_idx + 1 >= len(bin_maps):
             return False
         current_idx += 1
-        current_map = bin_maps[current_idx]
         current_size = bin_sizes[current_idx]
         update_status(
             f"Switching to next container [{current_idx}/{len(bin_maps) - 1}]: "
-            f"{os.path.basename(bin_paths[current_idx])}",
+            f"{bin_names[current_idx]}",
             "blue",
         )
         return True
 
-    try:
-        for i in range(total_entries):
-            start = i * entry_size
-            end = start + entry_size
-            chunk = idx_data[start:end]
-            if len(chunk) < entry_size:
-                continue
-
-            vals = parse_idx_entry(chunk, raw_vars, field_size, endian)
-
-            if shift_bits:
-                for name in vars_to_shift:
-                    if name in vals:
-                        vals[name] = vals[name] << shift_bits
+    for i in range(total_entries):
+        offset = offsets[i]
+        size_to_read = sizes_to_read[i]
 
-            offset = vals.get("Offset", 0)
-            original_sz = vals.get("Original_Size", vals.get("Full_Size", 0))
-            compressed_sz = vals.get("Compressed_Size", 0)
-            flag = vals.get("Compression_Marker", 0)
-
-            if offset == 0 and container_counts[current_idx] > 0:
-                if not advance_container():
-                    update_status(
-                        f"Entry {i} resets to offset 0, but there is no next "
-                        f"container available; skipping.",
-                        "red",
-                    )
-                    continue
-
-            if original_sz == 0 and compressed_sz == 0:
-                continue
-
-            # PC only size_to_read selection
-            if compressed_sz == 0:
-                continue
-
-            size_to_read = original_sz
-            if compressed_sz > 0 and flag == 1:
-                size_to_read = compressed_sz
-
-            if size_to_read <= 0:
+        if offset == 0 and container_counts[current_idx] > 0:
+            if not advance_container():
+                update_status(
+                    f"Entry {i} resets to offset 0, but there is no next "
+                    f"container available; skipping.",
+                    "red",
+                )
                 continue
 
-            while offset + size_to_read > current_size:
-                if not advance_container():
-                    update_status(
-                        f"Entry {i} (offset {offset}, size {size_to_read}) "
-                        f"does not fit in remaining containers; skipping.",
-                        "red",
-                    )
-                    size_to_read = 0
-                    break
-            if size_to_read <= 0:
-                continue
+        if size_to_read <= 0:
+            continue
 
-            if offset + size_to_read > current_size:
+        while offset + size_to_read > current_size:
+            if not advance_container():
                 update_status(
-                    f"Entry {i} out of range in "
-                    f"{os.path.basename(bin_paths[current_idx])} "
-                    f"(offset=0x{offset:X}, size=0x{size_to_read:X}); skipping.",
+                    f"Entry {i} (offset {offset}, size {size_to_read}) "
+                    f"does not fit in remaining containers; skipping.",
                     "red",
                 )
-                continue
+                size_to_read = 0
+                break
+        if size_to_read <= 0:
+            continue
 
-            raw = current_map[offset:offset + size_to_read]
-            data = raw
-            ext_hint = None
-            used_raw = False
-            raw_error = None
-            did_decompress = False
+        if offset + size_to_read > current_size:
+            update_status(
+                f"Entry {i} out of range in "
+                f"{bin_names[current_idx]} "
+                f"(offset=0x{offset:X}, size=0x{size_to_read:X}); skipping.",
+                "red",
+            )
+            continue
 
-            # PC compressed (flag==1)
-            if compressed_sz > 0 and flag == 1:
-                try:
-                    if compression_kind in ("zlib_split", "omega_split"):
-                        try:
-                            data, ext_hint, did_decompress = prepare_split_zlib_entry_for_unpack(raw)
-                        except Exception:
-                            data = codec_decompress(raw, "zlib_header")
-                            did_decompress = True
-
-                    elif compression_kind in (
-                        "zlib_header",
-                        "ozlib",
-                        "omega_zlib",
-                        "zlib",
-                        "auto",
-                        "pc_mixed",
-                    ):
-                        if looks_like_split_zlib(raw):
-                            try:
-                                data, ext_hint, did_decompress = prepare_split_zlib_entry_for_unpack(raw)
-                            except Exception:
-                                data = codec_decompress(raw, "zlib_header")
-                                did_decompress = True
-                        else:
-                            data = codec_decompress(raw, "zlib_header")
-                            did_decompress = True
-
-                    elif compression_kind in ("none", "raw"):
-                        data = raw
+        entry_plan.append((i, current_idx, container_counts[current_idx]))
+        container_counts[current_idx] += 1
 
-                    else:
-                        data = codec_decompress(raw, compression_kind)
-                        did_decompress = True
+    def finish_entry(future, i, offset, size_to_read, pack_idx):
+        out_path, out_name, data, failure = pool_result(future)
 
-                except Exception as e:
-                    used_raw = True
-                    raw_error = (
-                        f"{compression_kind} decompress failed at IDX entry {i} "
-                        f"(BIN={os.path.basename(bin_paths[current_idx])}, "
-                        f"offset=0x{offset:X}, size=0x{size_to_read:X}): {e}"
-                    )
-                    data = raw
-            else:
-                # Uncompressed/non-flagged entries
-
-                if compression_kind in (
-                    "zlib_split",
-                    "omega_split",
-                    "zlib_header",
-                    "ozlib",
-                    "omega_zlib",
-                    "zlib",
-                    "auto",
-                    "pc_mixed",
-                ) and looks_like_split_zlib(raw):
-                    try:
-                        data, ext_hint, did_decompress = prepare_split_zlib_entry_for_unpack(raw)
-                    except Exception as e:
-                        used_raw = True
-                        raw_error = (
-                            f"split-zlib fallback failed at IDX entry {i} "
-                            f"(BIN={os.path.basename(bin_paths[current_idx])}, "
-                            f"offset=0x{offset:X}, size=0x{size_to_read:X}): {e}"
-                        )
-                        data = raw
-
-            ext = resolve_unpacked_extension(data, ext_hint)
-
-            container_out_dir = os.path.join(out_root, f"Pack_{current_idx:02d}")
-            if not os.path.isdir(container_out_dir):
-                os.makedirs(container_out_dir, exist_ok=True)
-
-            local_index = container_counts[current_idx]
-            out_name = f"entry_{local_index:05d}{ext}"
-            out_path = os.path.join(container_out_dir, out_name)
-
-            with open(out_path, "wb") as fout:
-                fout.write(data)
+        unpack_nested_resource(out_path, blob=data)
 
-            # taildata, absolute IDX entry offset
-            entry_off_abs = start_from_offset + start
-            append_taildata(
-                out_path,
-                current_idx,
-                entry_off_abs,
-                1 if did_decompress else 0,
-                endian,
+        if failure is not None:
+            label, error = failure
+            msg = (
+                f"{label} at IDX entry {i} "
+                f"(BIN={bin_names[pack_idx]}, "
+                f"offset=0x{offset:X}, size=0x{size_to_read:X}): {error}"
+                f"; wrote raw to Pack_{pack_idx:02d}/{out_name}"
             )
+            log_comp_failure(out_root, msg)
+
+        if update_progress is not None:
+            if (i & 31) == 0 or i + 1 == total_entries:
+                update_progress(
+                    i + 1,
+                    total_entries,
+                    f"Multi-container: {i + 1}/{total_entries}",
+                )
+
+    pack_dirs = [os.path.join(out_root, f"Pack_{k:02d}") for k in range(len(bin_files))]
+    # Filled inside the try, a failed folder or pool setup still closes the maps and anything opened before it
+    pack_dir_fds = [None] * len(bin_files)
+    pending = deque()
+    queued_sizes = deque()
+    queued_bytes = 0
+    bin_views = []
+    container_released = [0] * len(bin_files)
+    pool = None
+    raw = None
 
-            unpack_nested_resource(out_path, blob=data)
+    try:
+        # Only containers that received entries get a Pack_XX folder, created once here instead of per entry
+        for k, count in enumerate(container_counts):
+            if count:
+                os.makedirs(pack_dirs[k], exist_ok=True)
+                pack_dir_fds[k] = open_output_dir(pack_dirs[k])
+
+        bin_views = [memoryview(mm) for mm in bin_maps]
+        pool = ThreadPoolExecutor(max_workers=UNPACK_WORKERS)
 
-            container_counts[current_idx] += 1
+        for i, pack_idx, local_index in entry_plan:
+            offset = offsets[i]
+            size_to_read = sizes_to_read[i]
 
-            if used_raw and raw_error:
-                msg = (
-                    f"{raw_error}; wrote raw to Pack_{current_idx:02d}/{out_name}"
+            raw = bin_views[pack_idx][offset:offset + size_to_read]
+            # taildata, absolute IDX entry offset
+            pending.append((
+                pool.submit(
+                    unpack_idx_entry_to_file,
+                    raw,
+                    flagged_entries[i],
+                    compression_kind,
+                    original_sizes[i],
+                    pack_dirs[pack_idx],
+                    local_index,
+                    pack_idx,
+                    start_from_offset + i * entry_size,
+                    endian,
+                    bin_files[pack_idx].fileno(),
+                    offset,
+                    pack_dir_fds[pack_idx],
+                ),
+                i, offset, size_to_read, pack_idx,
+            ))
+
+            if offset - container_released[pack_idx] >= UNPACK_RELEASE_SPAN:
+                container_released[pack_idx] = release_mapped_pages(
+                    bin_maps[pack_idx], container_released[pack_idx], offset
                 )
-                log_comp_failure(out_root, msg)
-
-            if update_progress is not None:
-                if (i & 31) == 0 or i + 1 == total_entries:
-                    update_progress(
-                        i + 1,
-                        total_entries,
-                        f"Multi-container: {i + 1}/{total_entries}",
-                    )
+
+            entry_bytes = max(size_to_read, original_sizes[i])
+            queued_sizes.append(entry_bytes)
+            queued_bytes += entry_bytes
+            while pending and (len(pending) >= UNPACK_QUEUE_LIMIT or queued_bytes > UNPACK_QUEUE_BYTES):
+                queued_bytes -= queued_sizes.popleft()
+                finish_entry(*pending.popleft())
+
+        while pending:
+            finish_entry(*pending.popleft())
 
     finally:
+        # Every view into the maps has to be gone before they can close
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        pending.clear()
+        raw = None
+        for dir_fd in pack_dir_fds:
+            if dir_fd is not None:
+                os.close(dir_fd)
+        for mv in bin_views:
+            mv.release()
         for mm in bin_maps:
-            try:
-                mm.close()
-            except Exception:
-                pass
+            mm.close()
         for f in bin_files:
             try:
                 f.close()
@@ -3608,52 +4123,65 @@ def unpack_multi_containers(
 
 
 def detect_ext(data: bytes) -> str:
-    """Best effort extension guess from magic bytes"""
+    """
+    Best effort extension guess from magic bytes
+    Only the first 64 bytes are ever read, bytes slicing copies just those so callers pass whole chunks
+    """
     if not data:
         return ".bin"
 
-    head = data[:64]
-    head4 = head[:4]
-    head3 = head[:3]
-    head2 = head[:2]
-
+    # Most entries resolve on the prefix tables, so the 64 byte head is only cut once they miss
+    head4 = data[:4]
     ext = EXT4.get(head4)
     if ext:
         if ext == ".riff":
-            return ".wav" if b"WAVEfmt" in head else ".riff"
+            return ".wav" if b"WAVEfmt" in data[:64] else ".riff"
         return ext
 
-    ext = EXT3.get(head3)
+    ext = EXT3.get(head4[:3]) or EXT2.get(head4[:2])
     if ext:
         return ext
 
-    ext = EXT2.get(head2)
-    if ext:
-        return ext
+    return detect_late_ext(data[:64])
 
-    ext = detect_dx9_shader_ext(data, 0)
-    if ext:
-        return ext
+
+@lru_cache(maxsize=4096)
+def detect_late_ext(head: bytes) -> str:
+    """
+    detect_ext probes past the prefix tables, cached on the 64 byte head they read
+    Misses tend to share heads within a container, same format and often the same header fields
+    """
+    head4 = head[:4]
+
+    # D3D9 shader tokens are 0xFFFE/0xFFFF in their high word, so byte 3 is always 0xFF
+    if head4[3:4] == b"\xFF":
+        ext = detect_dx9_shader_ext(head, 0)
+        if ext:
+            return ext
 
     if head.startswith(b"\x89PNG\r\n\x1a\n"):
         return ".png"
     if b"JFIF" in head:
         return ".jpg"
-    if head.startswith(b"TIM2") or b"TIM2" in head or head4 == b"\x00\x20\xAF\x30":
+    if b"TIM2" in head or head4 == b"\x00\x20\xAF\x30":
         return ".tm2"
-    if data.startswith(b"SShd"):
-        return ".ss2"
-    if data.startswith(b"SSbd"):
-        return ".ss2bd"
-    if data.startswith(b"IECSsreV"):
-        return ".vagbank"
-    if head.startswith(b"[glo"):
-        return ".ini"
+
+    late = LATE_MAGIC4.get(head4)
+    if late is not None and head.startswith(late[0]):
+        return late[1]
     if head4 == b"\x58\x4B\x4D":
         return ".xkm"
-    if head4 == b"\x45\x4D\x06\x00":
-        return ".EM"
 
     return ".bin"
+
+
+# Prefix magics checked after the substring probes above, keyed by their first 4 bytes
+LATE_MAGIC4 = {
+    b"SShd": (b"SShd", ".ss2"),
+    b"SSbd": (b"SSbd", ".ss2bd"),
+    b"IECS": (b"IECSsreV", ".vagbank"),
+    b"[glo": (b"[glo", ".ini"),
+    b"\x45\x4D\x06\x00": (b"\x45\x4D\x06\x00", ".EM"),
+}
 def unpack_kvs(path: str, blob: bytes | None = None) -> None:
     unpack_nested_resource(path, blob=blob)